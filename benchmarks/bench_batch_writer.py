@@ -0,0 +1,61 @@
+# pipenv run python -m benchmarks.bench_batch_writer
+# requires a local dynamodb stand-in (DynamoDB Local or moto_server) at DYNAMODB_ENDPOINT
+import os
+import time
+
+import boto3
+
+import syngenta_digital_dta
+
+ENDPOINT = os.getenv('DYNAMODB_ENDPOINT', 'http://localhost:4000')
+TABLE_NAME = 'benchmark-batch-writer'
+
+
+def create_table():
+    client = boto3.client('dynamodb', endpoint_url=ENDPOINT)
+    try:
+        client.delete_table(TableName=TABLE_NAME)
+    except client.exceptions.ResourceNotFoundException:
+        pass
+    client.create_table(
+        TableName=TABLE_NAME,
+        BillingMode='PAY_PER_REQUEST',
+        AttributeDefinitions=[{'AttributeName': 'test_id', 'AttributeType': 'S'}],
+        KeySchema=[{'AttributeName': 'test_id', 'KeyType': 'HASH'}]
+    )
+    return syngenta_digital_dta.adapter(
+        engine='dynamodb',
+        table=TABLE_NAME,
+        endpoint=ENDPOINT,
+        model_schema='test-dynamo-model',
+        model_schema_file='tests/openapi.yml',
+        model_identifier='test_id',
+        model_version_key='modified'
+    )
+
+
+def make_items(count):
+    return [{'test_id': f'id-{index}', 'payload': 'x' * 500, 'number': index} for index in range(count)]
+
+
+def run(count, concurrency_levels):
+    adapter = create_table()
+    items = make_items(count)
+    start = time.perf_counter()
+    with adapter.table.batch_writer() as writer:
+        for item in items:
+            writer.put_item(Item=item)
+    seconds = time.perf_counter() - start
+    print(f'{count} items | boto3 batch_writer: {count / seconds:,.0f} items/s')
+    for concurrency in concurrency_levels:
+        adapter = create_table()
+        start = time.perf_counter()
+        summary = adapter.batch_insert(data=items, concurrency=concurrency)
+        seconds = time.perf_counter() - start
+        assert summary['written'] == count
+        print(f'{count} items | concurrency {concurrency:>2}: {count / seconds:,.0f} items/s | '
+              f'retried: {summary["retried"]} | throttled: {summary["throttled"]}')
+
+
+if __name__ == '__main__':
+    run(10000, [1, 4, 8, 16])
@@ -0,0 +1,45 @@
+# pipenv run python -m benchmarks.bench_dict_merger
+import time
+import tracemalloc
+
+from syngenta_digital_dta.common import dict_merger
+
+
+def make_document(sections):
+    return {
+        'id': 'document-id',
+        'modified': '2020-10-05',
+        'sections': {
+            f'section-{section}': {
+                'title': f'title {section}',
+                'values': list(range(50)),
+                'attributes': {f'attribute-{attribute}': 'x' * 20 for attribute in range(20)}
+            }
+            for section in range(sections)
+        }
+    }
+
+
+def measure(document, patch, copy_mode, iterations):
+    tracemalloc.start()
+    dict_merger.merge(document, patch, copy_mode=copy_mode)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        dict_merger.merge(document, patch, copy_mode=copy_mode)
+    return (time.perf_counter() - start) / iterations, peak
+
+
+def run(sections, iterations=20):
+    document = make_document(sections)
+    patch = {'modified': '2020-10-06', 'sections': {'section-0': {'title': 'patched'}}}
+    deep_seconds, deep_peak = measure(document, patch, 'deep', iterations)
+    shared_seconds, shared_peak = measure(document, patch, 'shared', iterations)
+    print(f'{sections:>5} sections | deep: {deep_seconds * 1000:.2f}ms {deep_peak / 1024:.0f}KiB | '
+          f'shared: {shared_seconds * 1000:.3f}ms {shared_peak / 1024:.1f}KiB')
+
+
+if __name__ == '__main__':
+    for section_count in [10, 100, 1000]:
+        run(section_count)
@@ -0,0 +1,28 @@
+# pipenv run python -m benchmarks.bench_list_merge
+import time
+
+from syngenta_digital_dta.common import dict_merger
+
+
+def run(count):
+    original = {
+        'tags': [f'tag-{index}' for index in range(count)],
+        'objects': [{'id': index, 'value': f'value-{index}'} for index in range(count)]
+    }
+    patch = {
+        'tags': [f'tag-{index}' for index in range(count // 2, count + count // 2)],
+        'objects': [{'id': index, 'value': 'patched'} for index in range(count // 2, count + count // 2)]
+    }
+    results = []
+    for operation, key_field in [('add', None), ('remove', None), ('add', 'id'), ('remove', 'id')]:
+        start = time.perf_counter()
+        dict_merger.merge(original, patch, copy_mode='shared', update_list_operation=operation,
+                          update_list_key_field=key_field)
+        label = f'{operation}{"/" + key_field if key_field else ""}'
+        results.append(f'{label}: {time.perf_counter() - start:.3f}s')
+    print(f'{count:>7} items | ' + ' | '.join(results))
+
+
+if __name__ == '__main__':
+    for item_count in [1000, 10000, 100000]:
+        run(item_count)
@@ -0,0 +1,56 @@
+# pipenv run python -m benchmarks.bench_parallel_scan
+# requires a local dynamodb stand-in (DynamoDB Local or moto_server) at DYNAMODB_ENDPOINT
+import os
+import time
+
+import boto3
+
+import syngenta_digital_dta
+
+ENDPOINT = os.getenv('DYNAMODB_ENDPOINT', 'http://localhost:4000')
+TABLE_NAME = 'benchmark-parallel-scan'
+
+
+def create_table(count):
+    client = boto3.client('dynamodb', endpoint_url=ENDPOINT)
+    try:
+        client.delete_table(TableName=TABLE_NAME)
+    except client.exceptions.ResourceNotFoundException:
+        pass
+    client.create_table(
+        TableName=TABLE_NAME,
+        BillingMode='PAY_PER_REQUEST',
+        AttributeDefinitions=[{'AttributeName': 'test_id', 'AttributeType': 'S'}],
+        KeySchema=[{'AttributeName': 'test_id', 'KeyType': 'HASH'}]
+    )
+    table = boto3.resource('dynamodb', endpoint_url=ENDPOINT).Table(TABLE_NAME)
+    with table.batch_writer() as writer:
+        for index in range(count):
+            writer.put_item(Item={'test_id': f'id-{index}', 'payload': 'x' * 2000, 'number': index})
+
+
+def run(count, segment_counts):
+    create_table(count)
+    adapter = syngenta_digital_dta.adapter(
+        engine='dynamodb',
+        table=TABLE_NAME,
+        endpoint=ENDPOINT,
+        model_schema='test-dynamo-model',
+        model_schema_file='tests/openapi.yml',
+        model_identifier='test_id',
+        model_version_key='modified'
+    )
+    start = time.perf_counter()
+    sequential = adapter.scan()
+    sequential_seconds = time.perf_counter() - start
+    print(f'{count} items | sequential: {sequential_seconds:.2f}s')
+    for segments in segment_counts:
+        start = time.perf_counter()
+        parallel = adapter.scan(segments=segments)
+        seconds = time.perf_counter() - start
+        assert len(parallel) == len(sequential)
+        print(f'{count} items | {segments:>2} segments: {seconds:.2f}s | speedup: {sequential_seconds / seconds:.1f}x')
+
+
+if __name__ == '__main__':
+    run(20000, [2, 4, 8, 16])
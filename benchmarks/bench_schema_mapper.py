@@ -0,0 +1,46 @@
+# pipenv run python -m benchmarks.bench_schema_mapper
+import json
+import time
+
+from syngenta_digital_dta.common import schema_mapper
+
+SCHEMA_FILE = 'tests/openapi.yml'
+SCHEMA_KEY = 'test-dynamo-model'
+
+
+def make_records(count):
+    return [
+        {
+            'test_id': f'id-{index}',
+            'test_query_id': f'query-{index % 10}',
+            'ignore_key': True,
+            'object_key': {'string_key': 'nothing', 'ignore_key': index},
+            'array_number': [1, 2, 3],
+            'array_objects': [{'array_string_key': str(item), 'array_number_key': item} for item in range(5)],
+            'created': '2020-10-05',
+            'modified': '2020-10-05'
+        }
+        for index in range(count)
+    ]
+
+
+def run(count):
+    records = make_records(count)
+    schema_mapper.map_to_schema(records[0], SCHEMA_FILE, SCHEMA_KEY)  # warm schema cache
+
+    start = time.perf_counter()
+    walked = [schema_mapper.map_to_schema(record, SCHEMA_FILE, SCHEMA_KEY, compiled=False) for record in records]
+    walk_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    compiled = list(schema_mapper.map_many(records, SCHEMA_FILE, SCHEMA_KEY))
+    compiled_seconds = time.perf_counter() - start
+
+    assert json.dumps(walked) == json.dumps(compiled)
+    print(f'{count:>7} records | walk: {walk_seconds:.3f}s | compiled: {compiled_seconds:.3f}s | '
+          f'speedup: {walk_seconds / compiled_seconds:.1f}x')
+
+
+if __name__ == '__main__':
+    for record_count in [1000, 100000]:
+        run(record_count)
@@ -0,0 +1,58 @@
+# pipenv run python -m benchmarks.bench_serializer
+import time
+from decimal import Decimal
+
+import jsonpickle
+
+from syngenta_digital_dta.common import serializer
+
+
+def make_items(count):
+    return [
+        {
+            'test_id': f'id-{index}',
+            'test_query_id': f'query-{index % 10}',
+            'price': Decimal(f'{index}.25'),
+            'quantity': Decimal(index),
+            'object_key': {'string_key': 'nothing', 'number_key': Decimal('1.5')},
+            'array_number': [Decimal(1), Decimal(2), Decimal(3)],
+            'array_objects': [{'array_string_key': str(item), 'array_number_key': Decimal(item)} for item in range(5)],
+            'created': '2020-10-05T12:30:00+00:00',
+            'modified': '2020-10-05T12:30:00+00:00'
+        }
+        for index in range(count)
+    ]
+
+
+def measure(encode, decode, items):
+    start = time.perf_counter()
+    bodies = [encode(item) for item in items]
+    encode_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    for body in bodies:
+        decode(body)
+    decode_seconds = time.perf_counter() - start
+    return len(items) / encode_seconds, len(items) / decode_seconds
+
+
+def report(name, encode, decode, items):
+    encode_rate, decode_rate = measure(encode, decode, items)
+    print(f'{name:>10} | encode: {encode_rate:>10,.0f} items/s | decode: {decode_rate:>10,.0f} items/s')
+
+
+def run(count):
+    items = make_items(count)
+    print(f'{count} items')
+    report('jsonpickle', lambda item: jsonpickle.dumps(item, unpicklable=False, use_decimal=True), jsonpickle.decode, items)
+    for backend in ['simplejson', 'orjson']:
+        try:
+            serializer.set_backend(backend)
+        except Exception:
+            print(f'{backend:>10} | not installed')
+            continue
+        report(backend, serializer.dumps, serializer.loads, items)
+
+
+if __name__ == '__main__':
+    for item_count in [1000, 100000]:
+        run(item_count)
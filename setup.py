@@ -19,11 +19,13 @@ setup(
         'boto3',
         'elasticsearch==7.13.4',
         'jsonref',
-        'jsonpickle',
         'pyyaml',
         'requests-aws4auth',
         'simplejson'
     ],
+    extras_require={
+        'orjson': ['orjson']
+    },
     classifiers=[
         'Environment :: Web Environment',
         'Intended Audience :: Developers',
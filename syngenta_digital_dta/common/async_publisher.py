@@ -0,0 +1,124 @@
+import atexit
+import os
+import queue
+import tempfile
+import threading
+import time
+
+from syngenta_digital_dta.common import logger
+from syngenta_digital_dta.common import publisher
+from syngenta_digital_dta.common import serializer
+
+_lock = threading.Lock()
+_publishers = {}
+
+
+def get_async_publisher(**kwargs):
+    config = (
+        kwargs.get('workers', 2),
+        kwargs.get('queue_size', 1000),
+        kwargs.get('backpressure', 'block'),
+        kwargs.get('spill_path')
+    )
+    if config not in _publishers:
+        with _lock:
+            if config not in _publishers:
+                _publishers[config] = AsyncPublisher(
+                    workers=config[0], queue_size=config[1], backpressure=config[2], spill_path=config[3])
+    return _publishers[config]
+
+
+def flush_all(timeout=None):
+    for async_publisher in list(_publishers.values()):
+        async_publisher.flush(timeout)
+
+
+class AsyncPublisher:
+
+    def __init__(self, **kwargs):
+        self.backpressure = kwargs.get('backpressure', 'block')
+        if self.backpressure not in ('block', 'drop', 'spill'):
+            raise Exception(f'async publisher backpressure {self.backpressure} not supported; use block, drop or spill')
+        self.spill_path = kwargs.get('spill_path') or os.path.join(
+            tempfile.gettempdir(), f'syngenta-digital-dta-events-{os.getpid()}.jsonl')
+        self.__queue = queue.Queue(maxsize=kwargs.get('queue_size', 1000))
+        self.__spill_lock = threading.Lock()
+        self.__metrics_lock = threading.Lock()
+        self.__metrics = {'published': 0, 'dropped': 0, 'spilled': 0, 'latency_total': 0.0, 'latency_max': 0.0}
+        for _ in range(kwargs.get('workers', 2)):
+            threading.Thread(target=self.__work, daemon=True).start()
+
+    def enqueue(self, **kwargs):
+        if not kwargs.get('arn') or not kwargs.get('data'):
+            return
+        if self.backpressure == 'block':
+            self.__queue.put(kwargs)
+            return
+        try:
+            self.__queue.put_nowait(kwargs)
+        except queue.Full:
+            if self.backpressure == 'drop':
+                self.__increment('dropped')
+                logger.log(level='WARN', log={'error': 'publish_sns_error: async queue full, event dropped'})
+            else:
+                self.__spill(kwargs)
+
+    def flush(self, timeout=None):
+        self.__replay_spilled()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.__queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            time.sleep(0.01)
+        publisher.flush()
+
+    def metrics(self):
+        with self.__metrics_lock:
+            published = self.__metrics['published']
+            return {
+                'queue_depth': self.__queue.qsize(),
+                'published': published,
+                'dropped': self.__metrics['dropped'],
+                'spilled': self.__metrics['spilled'],
+                'latency_average': self.__metrics['latency_total'] / published if published else 0.0,
+                'latency_max': self.__metrics['latency_max']
+            }
+
+    def __work(self):
+        while True:
+            publish_kwargs = self.__queue.get()
+            start = time.perf_counter()
+            try:
+                publisher.publish(**publish_kwargs)
+            finally:
+                self.__record_latency(time.perf_counter() - start)
+                self.__queue.task_done()
+
+    def __record_latency(self, latency):
+        with self.__metrics_lock:
+            self.__metrics['published'] += 1
+            self.__metrics['latency_total'] += latency
+            self.__metrics['latency_max'] = max(self.__metrics['latency_max'], latency)
+
+    def __increment(self, metric):
+        with self.__metrics_lock:
+            self.__metrics[metric] += 1
+
+    def __spill(self, publish_kwargs):
+        with self.__spill_lock:
+            with open(self.spill_path, 'a', encoding='UTF-8') as spill_file:
+                spill_file.write(serializer.dumps(publish_kwargs) + '\n')
+        self.__increment('spilled')
+
+    def __replay_spilled(self):
+        with self.__spill_lock:
+            if not os.path.isfile(self.spill_path):
+                return
+            with open(self.spill_path, encoding='UTF-8') as spill_file:
+                spilled = [serializer.loads(line, use_decimal=True) for line in spill_file if line.strip()]
+            os.remove(self.spill_path)
+        for publish_kwargs in spilled:
+            publisher.publish(**publish_kwargs)
+
+
+atexit.register(flush_all)
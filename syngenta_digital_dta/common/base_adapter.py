@@ -2,10 +2,11 @@ from __future__ import annotations
 import typing
 from typing import TypedDict
 
+from syngenta_digital_dta.common import async_publisher
 from syngenta_digital_dta.common import publisher
 
 if typing.TYPE_CHECKING:
-    from typing import Any, Dict, Optional
+    from typing import Any, Dict, Literal, Optional
     from typing_extensions import Unpack
 
 
@@ -16,7 +17,17 @@ class BaseAdapter:
         self.sns_custom = kwargs.get('sns_attributes', {})
         self.sns_defaults = kwargs.get('sns_default_attributes', True)
         self.sns_endpoint = kwargs.get('sns_endpoint')
+        self.sns_buffered = kwargs.get('sns_buffered', False)
+        self.sns_buffer_max_age = kwargs.get('sns_buffer_max_age', 1)
         self.publisher = publisher
+        self.async_publisher = None
+        if kwargs.get('sns_async', False):
+            self.async_publisher = async_publisher.get_async_publisher(
+                workers=kwargs.get('sns_async_workers', 2),
+                queue_size=kwargs.get('sns_async_queue_size', 1000),
+                backpressure=kwargs.get('sns_async_backpressure', 'block'),
+                spill_path=kwargs.get('sns_async_spill_path')
+            )
         self.default_attributes = {
             'model_schema': kwargs.get('model_schema'),
             'model_identifier': kwargs.get('model_identifier'),
@@ -25,16 +36,31 @@ class BaseAdapter:
         }
 
     def publish(self, db_operation, db_data, **kwargs):
+        self.__publish(db_operation, db_data, batch=False, **kwargs)
+
+    def publish_batch(self, db_operation, db_items, **kwargs):
+        self.__publish(db_operation, db_items, batch=True, **kwargs)
+
+    def __publish(self, db_operation, db_data, batch, **kwargs):
         attributes = self.create_format_attibutes(db_operation)
-        self.publisher.publish(
+        publish = self.async_publisher.enqueue if self.async_publisher else self.publisher.publish
+        publish(
             endpoint=self.sns_endpoint,
             arn=self.sns_arn,
             attributes=attributes,
             data=db_data,
             fifo_group_id=kwargs.get('fifo_group_id'),
-            fifo_duplication_id=kwargs.get('fifo_duplication_id')
+            fifo_duplication_id=kwargs.get('fifo_duplication_id'),
+            buffered=self.sns_buffered,
+            max_age=self.sns_buffer_max_age,
+            batch=batch
         )
 
+    def flush_events(self, timeout=None):
+        if self.async_publisher:
+            self.async_publisher.flush(timeout)
+        self.publisher.flush()
+
     def create_format_attibutes(self, operation):
         self.default_attributes['operation'] = operation
         custom_attributes = self.get_attributes()
@@ -63,6 +89,13 @@ class BaseAdapterKwargs(TypedDict, total=False):
     sns_attributes: Optional[Dict[str, Any]]
     sns_default_attributes: bool # default is True
     sns_endpoint: Optional[str]
+    sns_buffered: bool # default is False
+    sns_buffer_max_age: float # default is 1 (seconds)
+    sns_async: bool # default is False
+    sns_async_workers: int # default is 2
+    sns_async_queue_size: int # default is 1000
+    sns_async_backpressure: Literal['block', 'drop', 'spill'] # default is 'block'
+    sns_async_spill_path: Optional[str]
     model_schema: Optional[str]
     model_identifier: Optional[str]
     model_version_key: Optional[str]
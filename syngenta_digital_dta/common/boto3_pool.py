@@ -0,0 +1,60 @@
+import threading
+
+import boto3
+from botocore.config import Config
+
+_lock = threading.Lock()
+_sessions = {}
+_resources = {}
+_clients = {}
+
+
+def get_resource(service, **kwargs):
+    return _get_pooled(_resources, 'resource', service, **kwargs)
+
+
+def get_client(service, **kwargs):
+    return _get_pooled(_clients, 'client', service, **kwargs)
+
+
+def clear_pool():
+    with _lock:
+        _resources.clear()
+        _clients.clear()
+        _sessions.clear()
+
+
+def _get_pooled(pool, kind, service, **kwargs):
+    pool_key = (
+        service,
+        kwargs.get('endpoint'),
+        kwargs.get('region'),
+        kwargs.get('aws_access_key_id'),
+        kwargs.get('aws_secret_access_key'),
+        kwargs.get('aws_session_token'),
+        kwargs.get('max_pool_connections')
+    )
+    pooled = pool.get(pool_key)
+    if pooled is None:
+        # boto3 sessions are not thread-safe, so clients and resources are created under the lock
+        with _lock:
+            pooled = pool.get(pool_key)
+            if pooled is None:
+                pooled = pool[pool_key] = getattr(_get_session(), kind)(
+                    service,
+                    endpoint_url=kwargs.get('endpoint'),
+                    region_name=kwargs.get('region'),
+                    aws_access_key_id=kwargs.get('aws_access_key_id'),
+                    aws_secret_access_key=kwargs.get('aws_secret_access_key'),
+                    aws_session_token=kwargs.get('aws_session_token'),
+                    config=Config(max_pool_connections=kwargs['max_pool_connections'])
+                    if kwargs.get('max_pool_connections') else None
+                )
+    return pooled
+
+
+def _get_session():
+    # one shared session (and botocore session) so service models are loaded once per process
+    if 'default' not in _sessions:
+        _sessions['default'] = boto3.session.Session()
+    return _sessions['default']
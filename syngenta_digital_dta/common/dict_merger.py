@@ -1,21 +1,45 @@
 import copy
 
-import simplejson as json
+from syngenta_digital_dta.common import serializer
+
+_KEY_FIELD = object()
+_CANONICAL = object()
 
 
 def merge(original_data, new_data, **kwargs):
+    if kwargs.get('copy_mode', 'deep') == 'shared':
+        return _walk_shared_dict(original_data, new_data, **kwargs)
     updated_data = copy.deepcopy(original_data)
     _walk_dict(updated_data, new_data, **kwargs)
     return updated_data
 
 
+def flatten_paths(new_data, path=()):
+    for new_key, new_value in new_data.items():
+        if isinstance(new_value, dict) and new_value:
+            yield from flatten_paths(new_value, path + (new_key,))
+        else:
+            yield path + (new_key,), new_value
+
+
+def _walk_shared_dict(old_data, new_data, **kwargs):
+    updated_data = dict(old_data)
+    for new_key in new_data.keys():
+        if updated_data.get(new_key) and isinstance(new_data[new_key], dict):
+            updated_data[new_key] = _walk_shared_dict(updated_data[new_key], new_data[new_key], **kwargs)
+        elif isinstance(updated_data.get(new_key), list) and isinstance(new_data[new_key], list):
+            updated_data[new_key] = _merge_lists(updated_data[new_key], new_data[new_key], **kwargs)
+        else:
+            _merge_dicts(new_key, updated_data, new_data, kwargs.get('update_dict_operation', 'upsert'))
+    return updated_data
+
+
 def _walk_dict(old_data, new_data, **kwargs):
     for new_key in new_data.keys():
         if old_data.get(new_key) and isinstance(new_data[new_key], dict):
             _walk_dict(old_data[new_key], new_data[new_key], **kwargs)
         elif isinstance(old_data.get(new_key), list) and isinstance(new_data[new_key], list):
-            old_data[new_key] = _merge_lists(old_data[new_key], new_data[new_key],
-                                             kwargs.get('update_list_operation', 'add'))
+            old_data[new_key] = _merge_lists(old_data[new_key], new_data[new_key], **kwargs)
         else:
             _merge_dicts(new_key, old_data, new_data, kwargs.get('update_dict_operation', 'upsert'))
 
@@ -27,25 +51,47 @@ def _merge_dicts(dict_key, old_dict, new_dict, update_dict_operation='upsert'):
         old_dict[dict_key] = new_dict[dict_key]
 
 
-def _merge_lists(old_list, new_list, update_list_operation='add'):
+def _merge_lists(old_list, new_list, **kwargs):
+    update_list_operation = kwargs.get('update_list_operation', 'add')
+    key_field = kwargs.get('update_list_key_field')
     if update_list_operation == 'remove':
-        _remove_item_in_list(old_list, new_list)
+        old_list = _remove_items_in_list(old_list, new_list, key_field)
     elif update_list_operation == 'add':
-        _add_unique_item_in_list(old_list, new_list)
+        old_list = _add_unique_items_in_list(old_list, new_list, key_field)
     elif update_list_operation == 'replace':
         old_list = new_list
     return old_list
 
 
-def _remove_item_in_list(old_list, new_list):
-    for old_item in old_list:
-        old = sorted(old_item.items()) if isinstance(old_item, dict) else old_item
-        new = sorted(new_list[0].items()) if isinstance(new_list[0], dict) else new_list[0]
-        if json.dumps(old) == json.dumps(new):
-            old_list.remove(old_item)
+def _remove_items_in_list(old_list, new_list, key_field=None):
+    removed_items = {_hash_item(item, key_field) for item in new_list}
+    return [item for item in old_list if _hash_item(item, key_field) not in removed_items]
 
 
-def _add_unique_item_in_list(old_list, new_list):
+def _add_unique_items_in_list(old_list, new_list, key_field=None):
+    merged_list = list(old_list)
+    positions = {}
+    for index, item in enumerate(merged_list):
+        positions.setdefault(_hash_item(item, key_field), index)
     for item in new_list:
-        if item not in old_list:
-            old_list.append(item)
+        item_hash = _hash_item(item, key_field)
+        if item_hash not in positions:
+            positions[item_hash] = len(merged_list)
+            merged_list.append(item)
+        elif _has_key_field(item, key_field):
+            merged_list[positions[item_hash]] = item
+    return merged_list
+
+
+def _hash_item(item, key_field=None):
+    if _has_key_field(item, key_field):
+        return (_KEY_FIELD, _hash_item(item[key_field]))
+    try:
+        hash(item)
+        return item
+    except TypeError:
+        return (_CANONICAL, serializer.dumps(item, sort_keys=True, default=str))
+
+
+def _has_key_field(item, key_field):
+    return key_field is not None and isinstance(item, dict) and key_field in item
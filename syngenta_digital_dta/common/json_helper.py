@@ -1,15 +1,15 @@
-import json
+from syngenta_digital_dta.common import serializer
 
 
 def try_decode_json(possible_json):
     try:
-        return json.loads(possible_json)
+        return serializer.loads(possible_json)
     except Exception:
         return possible_json
 
 
 def try_encode_json(possible_json):
     try:
-        return json.dumps(possible_json)
+        return serializer.dumps(possible_json)
     except Exception:
         return possible_json
@@ -1,23 +1,147 @@
+import atexit
+import threading
+import time
+
 import boto3
-import simplejson as json
 
 from syngenta_digital_dta.common import logger
+from syngenta_digital_dta.common import serializer
+
+MAX_BATCH_ENTRIES = 10
+MAX_BATCH_BYTES = 262144
+
+_lock = threading.RLock()
+_clients = {}
+_buffers = {}
 
 
 def publish(**kwargs):
     if not kwargs.get('arn') or not kwargs.get('data'):
         return
     try:
-        publisher = boto3.client('sns', region_name=kwargs.get('region'), endpoint_url=kwargs.get('endpoint'))
-        publish_kwargs = {
-            'TopicArn': kwargs['arn'],
-            'Message': json.dumps(kwargs['data']),
-            'MessageAttributes': kwargs.get('attributes', {})
-        }
+        if kwargs.get('batch'):
+            _publish_items(**kwargs)
+        elif kwargs.get('buffered'):
+            _buffer_message(**kwargs)
+        else:
+            publisher = get_client(kwargs.get('region'), kwargs.get('endpoint'))
+            publisher.publish(TopicArn=kwargs['arn'], **_build_message(**kwargs))
+    except Exception as e:
+        logger.log(level='WARN', log={'error': f'publish_sns_error: {e}'})
+
+
+def flush():
+    with _lock:
+        buffers = list(_buffers.items())
+        _buffers.clear()
+    for buffer_key, buffer in buffers:
+        _send_batch(buffer_key, buffer['messages'])
+
+
+def get_client(region=None, endpoint=None):
+    client_key = (region, endpoint)
+    if client_key not in _clients:
+        with _lock:
+            if client_key not in _clients:
+                _clients[client_key] = boto3.client('sns', region_name=region, endpoint_url=endpoint)
+    return _clients[client_key]
+
+
+def _build_message(**kwargs):
+    message = {
+        'Message': serializer.dumps(kwargs['data']),
+        'MessageAttributes': kwargs.get('attributes', {})
+    }
+    if kwargs.get('fifo_group_id'):
+        message['MessageGroupId'] = kwargs['fifo_group_id']
+    if kwargs.get('fifo_duplication_id'):
+        message['MessageDeduplicationId'] = kwargs['fifo_duplication_id']
+    return message
+
+
+def _publish_items(**kwargs):
+    batch_key = (kwargs.get('region'), kwargs.get('endpoint'), kwargs['arn'])
+    attributes = kwargs.get('attributes', {})
+    messages = []
+    for index, body in enumerate(_pack_items(kwargs['data'], MAX_BATCH_BYTES - _get_attributes_size(attributes))):
+        message = {'Message': body, 'MessageAttributes': attributes}
         if kwargs.get('fifo_group_id'):
-            publish_kwargs['MessageGroupId'] = kwargs['fifo_group_id']
+            message['MessageGroupId'] = kwargs['fifo_group_id']
         if kwargs.get('fifo_duplication_id'):
-            publish_kwargs['MessageDeduplicationId'] = kwargs['fifo_duplication_id']
-        publisher.publish(**publish_kwargs)
+            message['MessageDeduplicationId'] = f'{kwargs["fifo_duplication_id"]}-{index}'
+        messages.append(message)
+    batch = []
+    batch_size = 0
+    for message in messages:
+        message_size = _get_message_size(message)
+        if batch and (len(batch) >= MAX_BATCH_ENTRIES or batch_size + message_size > MAX_BATCH_BYTES):
+            _send_batch(batch_key, batch)
+            batch = []
+            batch_size = 0
+        batch.append(message)
+        batch_size += message_size
+    if batch:
+        _send_batch(batch_key, batch)
+
+
+def _pack_items(items, max_bytes):
+    bodies = []
+    size = 2
+    for item in items:
+        body = serializer.encode(item)
+        body_size = len(body) + 1
+        if bodies and size + body_size > max_bytes:
+            yield (b'[' + b','.join(bodies) + b']').decode('utf-8')
+            bodies = []
+            size = 2
+        bodies.append(body)
+        size += body_size
+    if bodies:
+        yield (b'[' + b','.join(bodies) + b']').decode('utf-8')
+
+
+def _buffer_message(**kwargs):
+    buffer_key = (kwargs.get('region'), kwargs.get('endpoint'), kwargs['arn'])
+    message = _build_message(**kwargs)
+    message_size = _get_message_size(message)
+    batches = []
+    with _lock:
+        buffer = _buffers.get(buffer_key)
+        if buffer and buffer['size'] + message_size > MAX_BATCH_BYTES:
+            batches.append(_buffers.pop(buffer_key)['messages'])
+            buffer = None
+        if not buffer:
+            buffer = _buffers[buffer_key] = {'messages': [], 'size': 0, 'created': time.monotonic()}
+        buffer['messages'].append(message)
+        buffer['size'] += message_size
+        is_full = len(buffer['messages']) >= MAX_BATCH_ENTRIES
+        is_stale = time.monotonic() - buffer['created'] >= kwargs.get('max_age', 1)
+        if is_full or is_stale:
+            batches.append(_buffers.pop(buffer_key)['messages'])
+    for messages in batches:
+        _send_batch(buffer_key, messages)
+
+
+def _send_batch(buffer_key, messages):
+    region, endpoint, arn = buffer_key
+    entries = [{'Id': str(index), **message} for index, message in enumerate(messages)]
+    try:
+        response = get_client(region, endpoint).publish_batch(TopicArn=arn, PublishBatchRequestEntries=entries)
+        for failed in response.get('Failed', []):
+            logger.log(level='WARN', log={'error': f'publish_sns_error: {failed}'})
     except Exception as e:
         logger.log(level='WARN', log={'error': f'publish_sns_error: {e}'})
+
+
+def _get_message_size(message):
+    return len(message['Message'].encode('utf-8')) + _get_attributes_size(message['MessageAttributes'])
+
+
+def _get_attributes_size(attributes):
+    size = 0
+    for name, attribute in attributes.items():
+        size += len(name) + len(attribute['DataType']) + len(str(attribute.get('StringValue', '')).encode('utf-8'))
+    return size
+
+
+atexit.register(flush)
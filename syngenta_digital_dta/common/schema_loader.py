@@ -1,9 +1,65 @@
+import os
+import threading
+
 import simplejson as json
 import jsonref
 import yaml
 
+_lock = threading.RLock()
+_documents = {}
+_schemas = {}
+_stats = {'hits': 0, 'misses': 0}
+
 
 def load_schema(schema_file, schema_key):
+    signature = _get_file_signature(schema_file)
+    cache_key = (os.path.abspath(schema_file), schema_key)
+    cached = _schemas.get(cache_key)
+    if cached and cached['signature'] == signature:
+        _stats['hits'] += 1
+        return cached['schema']
+    with _lock:
+        _stats['misses'] += 1
+        schema = _load_document(schema_file, signature)['components']['schemas'][schema_key]
+        _schemas[cache_key] = {'signature': signature, 'schema': schema}
+    return schema
+
+
+def warm_cache(schema_file, schema_keys=None):
+    if schema_keys is None:
+        schema_keys = _load_document(schema_file, _get_file_signature(schema_file))['components']['schemas'].keys()
+    return {schema_key: load_schema(schema_file, schema_key) for schema_key in schema_keys}
+
+
+def cache_info():
+    return {
+        'hits': _stats['hits'],
+        'misses': _stats['misses'],
+        'documents': len(_documents),
+        'schemas': len(_schemas)
+    }
+
+
+def clear_cache():
+    with _lock:
+        _documents.clear()
+        _schemas.clear()
+        _stats['hits'] = 0
+        _stats['misses'] = 0
+
+
+def _load_document(schema_file, signature):
+    document_key = os.path.abspath(schema_file)
+    cached = _documents.get(document_key)
+    if cached and cached['signature'] == signature:
+        return cached['document']
     with open(schema_file, encoding='UTF-8') as openapi:
         api_doc = yaml.load(openapi, Loader=yaml.FullLoader)
-    return jsonref.loads(json.dumps(api_doc))['components']['schemas'][schema_key]
+    document = jsonref.loads(json.dumps(api_doc))
+    _documents[document_key] = {'signature': signature, 'document': document}
+    return document
+
+
+def _get_file_signature(schema_file):
+    stat = os.stat(schema_file)
+    return (stat.st_mtime_ns, stat.st_size)
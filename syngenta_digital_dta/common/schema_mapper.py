@@ -1,7 +1,18 @@
+import collections
+import itertools
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
 from syngenta_digital_dta.common import schema_loader
 
+_lock = threading.Lock()
+_mappers = {}
+
 
-def map_to_schema(data, schema_file, schema_key):
+def map_to_schema(data, schema_file, schema_key, compiled=True):
+    if compiled:
+        return compile_mapper(schema_file, schema_key)(data)
     model_data = {}
     model_schema = schema_loader.load_schema(schema_file, schema_key)
     schemas = model_schema['allOf'] if model_schema.get('allOf') else [model_schema]
@@ -11,6 +22,111 @@ def map_to_schema(data, schema_file, schema_key):
     return model_data
 
 
+def map_partial_to_schema(data, schema_file, schema_key):
+    return compile_mapper(schema_file, schema_key, partial=True)(data)
+
+
+def map_many(records, schema_file, schema_key, workers=None, chunk_size=1000):
+    if workers and workers > 1:
+        yield from _map_chunks_in_pool(records, schema_file, schema_key, workers, chunk_size)
+        return
+    mapper = compile_mapper(schema_file, schema_key)
+    for record in records:
+        yield mapper(record)
+
+
+def compile_mapper(schema_file, schema_key, partial=False):
+    model_schema = schema_loader.load_schema(schema_file, schema_key)
+    cache_key = (schema_file, schema_key, partial)
+    cached = _mappers.get(cache_key)
+    if cached and cached[0] is model_schema:
+        return cached[1]
+    with _lock:
+        mapper = _compile_schema(model_schema, partial)
+        _mappers[cache_key] = (model_schema, mapper)
+    return mapper
+
+
+def _map_chunks_in_pool(records, schema_file, schema_key, workers, chunk_size):
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+        pending = collections.deque()
+        for chunk in _chunk_records(records, chunk_size):
+            pending.append(executor.submit(_map_chunk, chunk, schema_file, schema_key))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _map_chunk(chunk, schema_file, schema_key):
+    mapper = compile_mapper(schema_file, schema_key)
+    return [mapper(record) for record in chunk]
+
+
+def _chunk_records(records, chunk_size):
+    records = iter(records)
+    chunk = list(itertools.islice(records, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(itertools.islice(records, chunk_size))
+
+
+def _compile_schema(model_schema, partial=False):
+    schemas = model_schema['allOf'] if model_schema.get('allOf') else [model_schema]
+    plan = []
+    for model in schemas:
+        if model.get('type') == 'object':
+            plan.extend(_compile_plan(model.get('properties', {}), partial))
+    return _build_object_mapper(tuple(plan), partial)
+
+
+def _compile_plan(properties, partial=False):
+    plan = []
+    for property_key, property_value in properties.items():
+        if property_value.get('properties'):
+            object_mapper = _build_object_mapper(_compile_plan(property_value['properties'], partial), partial)
+            plan.append((property_key, object_mapper))
+        elif property_value.get('items', {}).get('properties'):
+            item_mapper = _build_object_mapper(_compile_plan(property_value['items']['properties']))
+            plan.append((property_key, _build_list_mapper(item_mapper)))
+        else:
+            plan.append((property_key, None))
+    return tuple(plan)
+
+
+def _build_object_mapper(plan, partial=False):
+    def map_partial_object(data):
+        model_data = {}
+        if data and isinstance(data, dict):
+            for property_key, mapper in plan:
+                if property_key not in data:
+                    continue
+                if mapper is None:
+                    model_data[property_key] = data[property_key]
+                else:
+                    model_data[property_key] = mapper(data[property_key])
+        return model_data
+
+    def map_object(data):
+        model_data = {}
+        if data and isinstance(data, dict):
+            for property_key, mapper in plan:
+                if mapper is None:
+                    model_data[property_key] = data.get(property_key)
+                else:
+                    model_data[property_key] = mapper(data.get(property_key))
+        return model_data
+    return map_partial_object if partial else map_object
+
+
+def _build_list_mapper(item_mapper):
+    def map_list(data):
+        if data and isinstance(data, list):
+            return [item_mapper(item) for item in data]
+        return []
+    return map_list
+
+
 def _populate_model_data(properties, data, model_data):
     if data and isinstance(data, dict):
         _populate_model_dict(properties, data, model_data)
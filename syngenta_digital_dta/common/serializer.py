@@ -0,0 +1,97 @@
+import base64
+import datetime
+import decimal
+
+import simplejson
+from boto3.dynamodb.types import Binary
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_backends = {}
+_settings = {}
+
+
+def dumps(data, sort_keys=False, default=None):
+    return encode(data, sort_keys=sort_keys, default=default).decode('utf-8')
+
+
+def encode(data, sort_keys=False, default=None):
+    return _backends[_settings['backend']]['encode'](data, sort_keys=sort_keys, default=_get_default(default))
+
+
+def loads(data, use_decimal=False):
+    if use_decimal:
+        return simplejson.loads(data, use_decimal=True)
+    return _backends[_settings['backend']]['decode'](data)
+
+
+def register_backend(name, encoder, decoder):
+    _backends[name] = {'encode': encoder, 'decode': decoder}
+
+
+def set_backend(name):
+    if name not in _backends:
+        raise Exception(f'serializer backend {name} not available; use one of {", ".join(_backends)}')
+    _settings['backend'] = name
+
+
+def get_backend():
+    return _settings['backend']
+
+
+def _get_default(default=None):
+    def convert(value):
+        if isinstance(value, decimal.Decimal):
+            return int(value) if value == value.to_integral_value() else float(value)
+        if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+            return value.isoformat()
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return base64.b64encode(value).decode('ascii')
+        if isinstance(value, Binary):
+            return base64.b64encode(value.value).decode('ascii')
+        if isinstance(value, (set, frozenset)):
+            return list(value)
+        if default:
+            return default(value)
+        raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+    return convert
+
+
+def _encode_bytes(data):
+    if isinstance(data, dict):
+        return {key: _encode_bytes(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_encode_bytes(value) for value in data]
+    if isinstance(data, bytes):
+        return base64.b64encode(data).decode('ascii')
+    return data
+
+
+def _simplejson_encode(data, sort_keys=False, default=None):
+    # simplejson writes bytes as utf-8 text natively; base64 them first to match orjson
+    return simplejson.dumps(
+        _encode_bytes(data),
+        separators=(',', ':'),
+        ensure_ascii=False,
+        sort_keys=sort_keys,
+        use_decimal=False,
+        default=default
+    ).encode('utf-8')
+
+
+def _orjson_encode(data, sort_keys=False, default=None):
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+    try:
+        return orjson.dumps(data, default=default, option=option)
+    except orjson.JSONEncodeError:
+        # integers beyond 64 bits (e.g. 38 digit DynamoDB numbers) are only supported by simplejson
+        return _simplejson_encode(data, sort_keys=sort_keys, default=default)
+
+
+register_backend('simplejson', _simplejson_encode, simplejson.loads)
+if orjson:
+    register_backend('orjson', _orjson_encode, orjson.loads)
+set_backend('orjson' if orjson else 'simplejson')
@@ -1,12 +1,43 @@
+import base64
+import queue
+import threading
+import time
 import typing
-from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
-import boto3
 from boto3.dynamodb.conditions import Attr
+from boto3.dynamodb.types import TypeDeserializer
+from boto3.dynamodb.types import TypeSerializer
 
+from syngenta_digital_dta.common import boto3_pool
 from syngenta_digital_dta.common import dict_merger
 from syngenta_digital_dta.common import schema_mapper
+from syngenta_digital_dta.common import serializer
 from syngenta_digital_dta.common.base_adapter import BaseAdapter
+from syngenta_digital_dta.dynamodb import batch_writer
+
+
+_SEGMENT_DONE = object()
+_TYPE_SERIALIZER = TypeSerializer()
+_TYPE_DESERIALIZER = TypeDeserializer()
+
+
+def _encode_continuation_token(last_evaluated_key):
+    if not last_evaluated_key:
+        return None
+    typed_key = {name: _TYPE_SERIALIZER.serialize(value) for name, value in last_evaluated_key.items()}
+    return base64.urlsafe_b64encode(serializer.encode(typed_key)).decode('ascii')
+
+
+def _decode_continuation_token(continuation_token):
+    try:
+        typed_key = serializer.loads(base64.urlsafe_b64decode(continuation_token.encode('ascii')))
+        for typed_value in typed_key.values():
+            if 'B' in typed_value:
+                typed_value['B'] = base64.b64decode(typed_value['B'])
+        return {name: _TYPE_DESERIALIZER.deserialize(typed_value) for name, typed_value in typed_key.items()}
+    except Exception as error:
+        raise Exception('invalid continuation token') from error
 
 
 class BatchItemException(Exception):
@@ -17,15 +48,23 @@ class DynamodbAdapter(BaseAdapter):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.table = self._get_dynamo_table(kwargs['table'], kwargs.get('endpoint'))
+        self.table = self._get_dynamo_table(**kwargs)
         self.model_schema_file = kwargs['model_schema_file']
         self.model_schema = kwargs['model_schema']
         self.model_identifier = kwargs['model_identifier']
         self.model_version_key = kwargs['model_version_key']
 
-    @lru_cache(maxsize=128)
-    def _get_dynamo_table(self, table, endpoint=None):
-        return boto3.resource('dynamodb', endpoint_url=endpoint).Table(table)
+    @staticmethod
+    def _get_dynamo_table(**kwargs):
+        return boto3_pool.get_resource(
+            'dynamodb',
+            endpoint=kwargs.get('endpoint'),
+            region=kwargs.get('region'),
+            aws_access_key_id=kwargs.get('aws_access_key_id'),
+            aws_secret_access_key=kwargs.get('aws_secret_access_key'),
+            aws_session_token=kwargs.get('aws_session_token'),
+            max_pool_connections=kwargs.get('max_pool_connections')
+        ).Table(kwargs['table'])
 
     def create(self, **kwargs):
         if kwargs.get('operation') == 'overwrite':
@@ -40,30 +79,40 @@ class DynamodbAdapter(BaseAdapter):
         return self.get(**kwargs)
 
     def paginate(self, func: typing.Callable, query: typing.Dict) -> typing.List[typing.Dict]:
-        if query.get('Limit'):
-            data = []
-            response = func(**query)
-            data.append(response)
-            query['Limit'] -= len(response['Items'])
+        return list(self.iter_pages(func, query))
 
-            while 'LastEvaluatedKey' in response and query['Limit'] != 0:
-                query['ExclusiveStartKey'] = response['LastEvaluatedKey']
-                response = func(**query)
-                data.append(response)
-                query['Limit'] -= len(response['Items'])
-
-        else:
+    def iter_pages(self, func: typing.Callable, query: typing.Dict,
+                   prefetch: bool = False) -> typing.Iterator[typing.Dict]:
+        if not query.get('Limit'):
             query.pop('Limit', None)
-            data = []
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
             response = func(**query)
-            data.append(response)
-            while 'LastEvaluatedKey' in response:
-                query['ExclusiveStartKey'] = response['LastEvaluatedKey']
-                response = func(**query)
-                data.append(response)
+            while True:
+                if query.get('Limit'):
+                    query['Limit'] -= len(response['Items'])
+                has_next = 'LastEvaluatedKey' in response and query.get('Limit', 1) > 0
+                if has_next:
+                    query['ExclusiveStartKey'] = response['LastEvaluatedKey']
+                    next_response = executor.submit(func, **query) if executor else None
+                yield response
+                if not has_next:
+                    return
+                response = next_response.result() if executor else func(**query)
+        finally:
+            if executor:
+                executor.shutdown(wait=False)
 
-        return data
+    def iter_query(self, **kwargs) -> typing.Iterator[typing.Dict]:
+        pages = self.iter_pages(self.table.query, kwargs.get('query', {}), prefetch=kwargs.get('prefetch', False))
+        return pages if kwargs.get('pages') else self.__iter_items(pages)
 
+    def iter_scan(self, **kwargs) -> typing.Iterator[typing.Dict]:
+        if kwargs.get('segments', 1) > 1:
+            pages = self.parallel_scan(kwargs.get('query', {}), kwargs['segments'], kwargs.get('progress'))
+        else:
+            pages = self.iter_pages(self.table.scan, kwargs.get('query', {}), prefetch=kwargs.get('prefetch', False))
+        return pages if kwargs.get('pages') else self.__iter_items(pages)
 
     @staticmethod
     def __flatten_items(raw_results):
@@ -72,21 +121,152 @@ class DynamodbAdapter(BaseAdapter):
             results.extend(result.get('Items', []))
         return results
 
+    @staticmethod
+    def __iter_items(raw_results):
+        for result in raw_results:
+            yield from result.get('Items', [])
+
+    def parallel_scan(self, query: typing.Dict, segments: int,
+                      progress: typing.Optional[typing.Callable] = None) -> typing.Iterator[typing.Dict]:
+        limit = query.get('Limit')
+        state = {'remaining': limit, 'yielded': 0}
+        lock = threading.Lock()
+        stop = threading.Event()
+        pages = queue.Queue(maxsize=segments * 2)
+        with ThreadPoolExecutor(max_workers=segments) as executor:
+            for segment in range(segments):
+                executor.submit(self.__scan_segment, query, segment, segments, state, lock, stop, pages, progress)
+            try:
+                finished = 0
+                while finished < segments:
+                    page = pages.get()
+                    if page is _SEGMENT_DONE:
+                        finished += 1
+                        continue
+                    if isinstance(page, Exception):
+                        raise page
+                    if limit:
+                        page['Items'] = page['Items'][:limit - state['yielded']]
+                        state['yielded'] += len(page['Items'])
+                    yield page
+                    if limit and state['yielded'] >= limit:
+                        break
+            finally:
+                stop.set()
+
+    def __scan_segment(self, query, segment, segments, state, lock, stop, pages, progress):
+        segment_query = {**query, 'Segment': segment, 'TotalSegments': segments}
+        segment_progress = {'segment': segment, 'total_segments': segments, 'pages': 0, 'items': 0,
+                            'scanned': 0, 'finished': False}
+        try:
+            while not stop.is_set():
+                with lock:
+                    if state['remaining'] is not None and state['remaining'] <= 0:
+                        break
+                    if state['remaining'] is not None:
+                        segment_query['Limit'] = state['remaining']
+                response = self.table.scan(**segment_query)
+                with lock:
+                    if state['remaining'] is not None:
+                        state['remaining'] -= len(response['Items'])
+                segment_progress['pages'] += 1
+                segment_progress['items'] += len(response['Items'])
+                segment_progress['scanned'] += response.get('ScannedCount', len(response['Items']))
+                self.__put_page(pages, stop, response)
+                if 'LastEvaluatedKey' not in response:
+                    break
+                segment_query['ExclusiveStartKey'] = response['LastEvaluatedKey']
+                if progress:
+                    progress(dict(segment_progress))
+        except Exception as error:
+            self.__put_page(pages, stop, error)
+        finally:
+            segment_progress['finished'] = True
+            if progress:
+                progress(dict(segment_progress))
+            self.__put_page(pages, stop, _SEGMENT_DONE)
+
+    @staticmethod
+    def __put_page(pages, stop, page):
+        while not stop.is_set():
+            try:
+                pages.put(page, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
     def scan(self, **kwargs):
-        raw_results = self.paginate(func=self.table.scan, query=kwargs.get('query', {}))
+        if kwargs.get('page_size'):
+            return self.__read_page(self.table.scan, **kwargs)
+        raw_results = self.iter_scan(**{**kwargs, 'pages': True})
         if kwargs.get('raw_scan'):
-            return raw_results
+            return list(raw_results)
         return self.__flatten_items(raw_results)
 
     def get(self, **kwargs):
         return self.table.get_item(**kwargs.get('query', {})).get('Item', {})
 
+    def batch_get(self, **kwargs):
+        keys = kwargs['keys']
+        if not isinstance(keys, list):
+            raise BatchItemException('Batched keys must be contained within a list')
+        if not keys:
+            return {} if kwargs.get('as_dict') else []
+        key_names = sorted(keys[0])
+        unique_keys = list({self.__get_key_signature(key, key_names): key for key in keys}.values())
+        chunks = [unique_keys[pos:pos + 100] for pos in range(0, len(unique_keys), 100)]
+        found = {}
+        with ThreadPoolExecutor(max_workers=min(kwargs.get('workers', 4), len(chunks))) as executor:
+            for items in executor.map(lambda chunk: self.__batch_get_chunk(chunk, **kwargs), chunks):
+                for item in items:
+                    found[self.__get_key_signature(item, key_names)] = item
+        signatures = (self.__get_key_signature(key, key_names) for key in keys)
+        results = [found[signature] for signature in signatures if signature in found]
+        if kwargs.get('as_dict'):
+            return {item[self.model_identifier]: item for item in results}
+        return results
+
+    @staticmethod
+    def __get_key_signature(record, key_names):
+        return tuple(record.get(name) for name in key_names)
+
+    def __batch_get_chunk(self, chunk, **kwargs):
+        request = {'Keys': chunk}
+        if kwargs.get('consistent_read'):
+            request['ConsistentRead'] = True
+        request_items = {self.table.name: request}
+        items = []
+        attempt = 0
+        while True:
+            response = self.table.meta.client.batch_get_item(RequestItems=request_items)
+            items.extend(response.get('Responses', {}).get(self.table.name, []))
+            request_items = response.get('UnprocessedKeys')
+            if not request_items:
+                return items
+            if attempt >= kwargs.get('max_retries', 8):
+                unprocessed = len(request_items[self.table.name]['Keys'])
+                raise BatchItemException(f'batch_get: {unprocessed} keys still unprocessed after {attempt} retries')
+            time.sleep(batch_writer.get_backoff(attempt))
+            attempt += 1
+
     def query(self, **kwargs):
-        raw_results = self.paginate(func=self.table.query, query=kwargs.get('query', {}))
+        if kwargs.get('page_size'):
+            return self.__read_page(self.table.query, **kwargs)
+        raw_results = self.iter_query(**{**kwargs, 'pages': True})
         if kwargs.get('raw_query'):
-            return raw_results
+            return list(raw_results)
         return self.__flatten_items(raw_results)
 
+    def __read_page(self, func, **kwargs):
+        query = {**kwargs.get('query', {}), 'Limit': kwargs['page_size']}
+        if kwargs.get('continuation_token'):
+            query['ExclusiveStartKey'] = _decode_continuation_token(kwargs['continuation_token'])
+        items = []
+        response = {}
+        for response in self.iter_pages(func, query):
+            items.extend(response.get('Items', []))
+        return {'items': items, 'continuation_token': _encode_continuation_token(response.get('LastEvaluatedKey'))}
+
     def overwrite(self, **kwargs):
         overwrite_item = schema_mapper.map_to_schema(kwargs['data'], self.model_schema_file, self.model_schema)
         self.table.put_item(Item=overwrite_item)
@@ -101,16 +281,17 @@ class DynamodbAdapter(BaseAdapter):
 
     def batch_insert(self, **kwargs):
         data = kwargs['data']
-        batch_size = kwargs.get('batch_size', 25)
 
         if not isinstance(data, list):
             raise BatchItemException('Batched data must be contained within a list')
 
-        batched_data = (data[pos:pos + batch_size] for pos in range(0, len(data), batch_size))
-        with self.table.batch_writer() as writer:
-            for batch in batched_data:
-                for item in batch:
-                    writer.put_item(Item=item)
+        if kwargs.get('map_to_schema', False):
+            data = schema_mapper.map_many(data, self.model_schema_file, self.model_schema, workers=kwargs.get('workers'))
+        writer = batch_writer.BatchWriter(self.table, track_written=bool(self.sns_arn), **kwargs)
+        summary = writer.write({'PutRequest': {'Item': item}} for item in data)
+        published_items = [request['PutRequest']['Item'] for request in writer.written_requests]
+        super().publish_batch('batch_insert', published_items, **kwargs)
+        return summary
 
     def delete(self, **kwargs):
         kwargs['query']['ReturnValues'] = 'ALL_OLD'
@@ -119,18 +300,19 @@ class DynamodbAdapter(BaseAdapter):
         return result
 
     def batch_delete(self, **kwargs):
-        batch_size = kwargs.get('batch_size', 25)
         if not isinstance(kwargs['data'], list):
             raise BatchItemException('Batched data must be contained within a list')
-        batched_data = (kwargs['data'][pos:pos + batch_size] for pos in range(0, len(kwargs['data']), batch_size))
-        with self.table.batch_writer() as writer:
-            for batch in batched_data:
-                for item in batch:
-                    writer.delete_item(Key=item)
+        writer = batch_writer.BatchWriter(self.table, track_written=bool(self.sns_arn), **kwargs)
+        summary = writer.write({'DeleteRequest': {'Key': key}} for key in kwargs['data'])
+        published_keys = [request['DeleteRequest']['Key'] for request in writer.written_requests]
+        super().publish_batch('batch_delete', published_keys, **kwargs)
+        return summary
 
     def update(self, **kwargs):
+        if kwargs.get('patch'):
+            return self._patch_item(**kwargs)
         original_data = self._get_original_data(**kwargs)
-        merged_data = dict_merger.merge(original_data, kwargs['data'], **kwargs)
+        merged_data = dict_merger.merge(original_data, kwargs['data'], **{'copy_mode': 'shared', **kwargs})
         updated_data = schema_mapper.map_to_schema(merged_data, self.model_schema_file, self.model_schema)
         self.table.put_item(Item=updated_data,
                             ConditionExpression=Attr(self.model_version_key).eq(original_data[self.model_version_key]))
@@ -145,3 +327,58 @@ class DynamodbAdapter(BaseAdapter):
         if not original_data:
             raise Exception('update: no data found to update')
         return original_data
+
+    def _patch_item(self, **kwargs):
+        key = kwargs['query']['Key']
+        patch_data = schema_mapper.map_partial_to_schema(kwargs['data'], self.model_schema_file, self.model_schema)
+        condition = Attr(self.model_identifier).exists()
+        if kwargs.get('expected_version') is not None:
+            condition = condition & Attr(self.model_version_key).eq(kwargs['expected_version'])
+        updated_data = self.table.update_item(
+            Key=key,
+            ConditionExpression=condition,
+            ReturnValues='ALL_NEW',
+            **self._build_update_expression(patch_data, key, **kwargs)
+        ).get('Attributes', {})
+        super().publish('update', updated_data, **kwargs)
+        return updated_data
+
+    @staticmethod
+    def _build_update_expression(patch_data, key, **kwargs):
+        names = {}
+        values = {}
+        set_actions = []
+        remove_actions = []
+        list_operation = kwargs.get('update_list_operation', 'add')
+        dict_operation = kwargs.get('update_dict_operation', 'upsert')
+        for path, value in dict_merger.flatten_paths(patch_data):
+            if path[0] in key:
+                continue
+            for part in path:
+                names.setdefault(part, f'#p{len(names)}')
+            name = '.'.join(names[part] for part in path)
+            if isinstance(value, list) and list_operation == 'remove':
+                raise Exception('patch: update_list_operation remove is not supported by dynamodb patch updates')
+            if isinstance(value, list) and list_operation == 'add':
+                placeholder = f':p{len(values)}'
+                values[placeholder] = value
+                values.setdefault(':empty_list', [])
+                set_actions.append(f'{name} = list_append(if_not_exists({name}, :empty_list), {placeholder})')
+            elif isinstance(value, list) or dict_operation != 'remove':
+                placeholder = f':p{len(values)}'
+                values[placeholder] = value
+                set_actions.append(f'{name} = {placeholder}')
+            else:
+                remove_actions.append(name)
+        if not set_actions and not remove_actions:
+            raise Exception('patch: no attributes to update')
+        expression = {
+            'UpdateExpression': ' '.join(
+                f'{action} {", ".join(actions)}'
+                for action, actions in (('SET', set_actions), ('REMOVE', remove_actions)) if actions
+            ),
+            'ExpressionAttributeNames': {placeholder: part for part, placeholder in names.items()}
+        }
+        if values:
+            expression['ExpressionAttributeValues'] = values
+        return expression
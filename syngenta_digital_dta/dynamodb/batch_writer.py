@@ -0,0 +1,105 @@
+import collections
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from botocore.exceptions import ClientError
+
+MAX_BATCH_SIZE = 25
+THROTTLE_ERRORS = ('ProvisionedThroughputExceededException', 'ThrottlingException', 'RequestLimitExceeded')
+
+
+def get_backoff(attempt, base=0.05, cap=5.0):
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+class BatchWriter:
+
+    def __init__(self, table, **kwargs):
+        self.table = table
+        self.batch_size = min(kwargs.get('batch_size', MAX_BATCH_SIZE), MAX_BATCH_SIZE)
+        self.concurrency = kwargs.get('concurrency', 4)
+        self.max_retries = kwargs.get('max_retries', 8)
+        self.track_written = kwargs.get('track_written', False)
+        self.written_requests = []
+        self.__lock = threading.Lock()
+        self.__throttle_delay = 0.0
+        self.__summary = {'written': 0, 'retried': 0, 'failed': 0, 'throttled': 0, 'failed_requests': []}
+
+    def write(self, requests):
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            pending = collections.deque()
+            for chunk in self.__chunk_requests(requests):
+                pending.append(executor.submit(self.__write_chunk, chunk))
+                if len(pending) >= self.concurrency * 2:
+                    pending.popleft().result()
+            while pending:
+                pending.popleft().result()
+        return self.summary()
+
+    def summary(self):
+        with self.__lock:
+            return {**self.__summary, 'failed_requests': list(self.__summary['failed_requests'])}
+
+    def __chunk_requests(self, requests):
+        requests = iter(requests)
+        chunk = list(itertools.islice(requests, self.batch_size))
+        while chunk:
+            yield chunk
+            chunk = list(itertools.islice(requests, self.batch_size))
+
+    def __write_chunk(self, chunk):
+        attempt = 0
+        while True:
+            self.__wait_for_throttle()
+            try:
+                response = self.table.meta.client.batch_write_item(RequestItems={self.table.name: chunk})
+            except ClientError as error:
+                if error.response['Error']['Code'] not in THROTTLE_ERRORS:
+                    raise
+                self.__throttle()
+                unprocessed = chunk
+            else:
+                self.__recover()
+                unprocessed = response.get('UnprocessedItems', {}).get(self.table.name, [])
+                self.__record_written([request for request in chunk if request not in unprocessed])
+            if not unprocessed:
+                return
+            if attempt >= self.max_retries:
+                self.__record_failed(unprocessed)
+                return
+            self.__increment('retried', len(unprocessed))
+            time.sleep(get_backoff(attempt))
+            attempt += 1
+            chunk = unprocessed
+
+    def __wait_for_throttle(self):
+        delay = self.__throttle_delay
+        if delay:
+            time.sleep(random.uniform(delay / 2, delay))
+
+    def __throttle(self):
+        with self.__lock:
+            self.__summary['throttled'] += 1
+            self.__throttle_delay = min(max(self.__throttle_delay * 2, 0.05), 5.0)
+
+    def __recover(self):
+        with self.__lock:
+            self.__throttle_delay = self.__throttle_delay / 2 if self.__throttle_delay > 0.01 else 0.0
+
+    def __increment(self, metric, count):
+        with self.__lock:
+            self.__summary[metric] += count
+
+    def __record_written(self, requests):
+        with self.__lock:
+            self.__summary['written'] += len(requests)
+            if self.track_written:
+                self.written_requests.extend(requests)
+
+    def __record_failed(self, requests):
+        with self.__lock:
+            self.__summary['failed'] += len(requests)
+            self.__summary['failed_requests'].extend(requests)
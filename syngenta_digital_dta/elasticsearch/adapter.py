@@ -2,7 +2,7 @@ from __future__ import annotations
 import typing
 from typing import Any, TypedDict, Optional, Dict
 
-from elasticsearch import Elasticsearch, exceptions
+from elasticsearch import Elasticsearch, exceptions, helpers
 
 from syngenta_digital_dta.common import schema_mapper
 from syngenta_digital_dta.common.base_adapter import BaseAdapter, BaseAdapterKwargs
@@ -65,6 +65,23 @@ class ElasticsearchAdapter(BaseAdapter):
         super().publish('create', data, **kwargs)
         return response
 
+    def batch_create(self, data, *, map_to_schema: bool = True, **kwargs):
+        if map_to_schema:
+            data = schema_mapper.map_many(data, self.model_schema_file, self.model_schema, workers=kwargs.get('workers'))
+        published_items = []
+        actions = (
+            self.__create_bulk_action(item, published_items)
+            for item in data
+        )
+        response = helpers.bulk(
+            self.connection,
+            actions,
+            chunk_size=kwargs.get('batch_size', 500),
+            refresh=kwargs.get('refresh', True)
+        )
+        super().publish_batch('batch_create', published_items, **kwargs)
+        return response
+
     def update(self, data: dict, **kwargs):
         response = self.connection.update(
             index=self.index,
@@ -153,6 +170,11 @@ class ElasticsearchAdapter(BaseAdapter):
             response = self.__normalize_hits(response)
         return response, next_token
 
+    def __create_bulk_action(self, item, published_items):
+        if self.sns_arn:
+            published_items.append(item)
+        return {'_op_type': 'create', '_index': self.index, '_id': item[self.model_identifier], '_source': item}
+
     def __normalize_hits(self, hits):
         normalized_hits = []
         for hit in hits.get('hits', {}).get('hits', []):
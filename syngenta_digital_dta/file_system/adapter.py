@@ -1,9 +1,9 @@
 import os
 import shutil
 
-import jsonpickle
 import requests
 
+from syngenta_digital_dta.common import serializer
 from syngenta_digital_dta.common.base_adapter import BaseAdapter
 from syngenta_digital_dta.s3.adapter import S3Adapter
 
@@ -32,7 +32,7 @@ class FileSystemAdapter(BaseAdapter):
             body = file.read()
 
         if kwargs.get('json', False):
-            return jsonpickle.decode(body)
+            return serializer.loads(body)
         return body
 
     def update(self, **kwargs):
@@ -1,6 +1,6 @@
 from functools import lru_cache
 
-from pymongo import MongoClient, operations
+from pymongo import MongoClient, ReturnDocument, operations
 
 from syngenta_digital_dta.common.base_adapter import BaseAdapter
 from syngenta_digital_dta.common import dict_merger
@@ -42,8 +42,8 @@ class MongoAdapter(BaseAdapter):
 
     def __map_documents(self, **kwargs):
         items = []
-        for item in kwargs['data']:
-            item = schema_mapper.map_to_schema(item, self.__model_schema_file, self.__model_schema)
+        for item in schema_mapper.map_many(kwargs['data'], self.__model_schema_file, self.__model_schema,
+                                            workers=kwargs.get('workers')):
             item['_id'] = item[self.__model_identifier]
             items.append(item)
         return items
@@ -51,7 +51,7 @@ class MongoAdapter(BaseAdapter):
     def batch_create(self, **kwargs):
         items = self.__map_documents(**kwargs)
         insert_result = self.__collection.insert_many(items, **kwargs.get('params', {}))
-        super().publish('batch_create', items, **kwargs)
+        super().publish_batch('batch_create', items, **kwargs)
         return insert_result
 
     def batch_upsert(self, **kwargs):
@@ -69,7 +69,7 @@ class MongoAdapter(BaseAdapter):
             ]
             batch_results = self.__collection.bulk_write(bulk_operations, **kwargs.get('params', {}))
             results.append(batch_results)
-            super().publish('batch_upsert', items, **kwargs)
+            super().publish_batch('batch_upsert', items, **kwargs)
 
         return results
 
@@ -96,19 +96,49 @@ class MongoAdapter(BaseAdapter):
         return self.__collection.count_documents(kwargs.get('query', {}), **kwargs.get('params', {}))
 
     def update(self, **kwargs):
+        if kwargs.get('patch'):
+            return self.__patch(**kwargs)
         original_data = self.find_one(**kwargs)
         if not original_data:
             raise Exception(f'no document found by query: {kwargs["query"]}')
-        merged_data = dict_merger.merge(original_data, kwargs['data'], **kwargs)
+        merged_data = dict_merger.merge(original_data, kwargs['data'], **{'copy_mode': 'shared', **kwargs})
         updated_data = schema_mapper.map_to_schema(merged_data, self.__model_schema_file, self.__model_schema)
         self.__collection.replace_one(kwargs['query'], updated_data, upsert=False)
         super().publish('update', updated_data, **kwargs)
         return updated_data
 
+    def __patch(self, **kwargs):
+        patch_data = schema_mapper.map_partial_to_schema(kwargs['data'], self.__model_schema_file, self.__model_schema)
+        updated_data = self.__collection.find_one_and_update(
+            kwargs['query'],
+            self.__build_update_document(patch_data, **kwargs),
+            return_document=ReturnDocument.AFTER
+        )
+        if not updated_data:
+            raise Exception(f'no document found by query: {kwargs["query"]}')
+        super().publish('update', updated_data, **kwargs)
+        return updated_data
+
+    def __build_update_document(self, patch_data, **kwargs):
+        update_document = {}
+        list_operation = kwargs.get('update_list_operation', 'add')
+        dict_operation = kwargs.get('update_dict_operation', 'upsert')
+        for path, value in dict_merger.flatten_paths(patch_data):
+            field = '.'.join(path)
+            if isinstance(value, list) and list_operation == 'add':
+                update_document.setdefault('$addToSet', {})[field] = {'$each': value}
+            elif isinstance(value, list) and list_operation == 'remove':
+                update_document.setdefault('$pull', {})[field] = {'$in': value}
+            elif isinstance(value, list) or dict_operation != 'remove':
+                update_document.setdefault('$set', {})[field] = value
+            else:
+                update_document.setdefault('$unset', {})[field] = ''
+        return update_document
+
     def upsert(self, **kwargs):
         original_data = self.find_one(**kwargs)
         if original_data:
-            merged_data = dict_merger.merge(original_data, kwargs['data'], **kwargs)
+            merged_data = dict_merger.merge(original_data, kwargs['data'], **{'copy_mode': 'shared', **kwargs})
         else:
             merged_data = kwargs['data']
         data = schema_mapper.map_to_schema(merged_data, self.__model_schema_file, self.__model_schema)
@@ -130,5 +160,5 @@ class MongoAdapter(BaseAdapter):
             bulk_operations.append(operations.DeleteOne(filter={'_id': item['_id']}))
 
         results = self.__collection.bulk_write(bulk_operations, **kwargs.get('params', {}))
-        super().publish('batch_delete', items, **kwargs)
+        super().publish_batch('batch_delete', items, **kwargs)
         return results
@@ -54,15 +54,29 @@ class PostgresAdapter(BaseAdapter):
         return params['data']
 
     def update(self, **kwargs):
+        if kwargs.get('patch'):
+            return self.__patch(**kwargs)
         exists = self.__get_existing(**kwargs)
         if not exists:
             self.__raise_error('NOT_EXISTS', **kwargs)
-        kwargs['data'] = dict_merger.merge(exists, kwargs['data'], **kwargs)
+        kwargs['data'] = dict_merger.merge(exists, kwargs['data'], **{'copy_mode': 'shared', **kwargs})
         update = self.__create_update_query(kwargs['data'])
         self.__execute(update['query'], update['params'], **kwargs)
         super().publish('update', kwargs['data'], **kwargs)
         return kwargs['data']
 
+    def __patch(self, **kwargs):
+        data = schema_mapper.map_partial_to_schema(kwargs['data'], self.model_schema_file, self.model_schema)
+        if kwargs.get('update_dict_operation') == 'remove':
+            data = {key: None for key in data}
+        data[self.model_identifier] = kwargs['data'][self.model_identifier]
+        update = self.__create_update_query(data)
+        self.__execute(update['query'], update['params'], **kwargs)
+        if not self.cursor.rowcount:
+            self.__raise_error('NOT_EXISTS', **kwargs)
+        super().publish('update', data, **kwargs)
+        return data
+
     def upsert(self, **kwargs):
         exists = self.__get_existing(**kwargs)
         if exists:
@@ -3,10 +3,10 @@ from io import BytesIO
 
 import boto3
 import botocore
-import jsonpickle
 from botocore.config import Config
 from botocore.exceptions import ClientError
 
+from syngenta_digital_dta.common import serializer
 from syngenta_digital_dta.common.base_adapter import BaseAdapter
 
 
@@ -248,8 +248,7 @@ class S3Adapter(BaseAdapter):
 
     def __set_results(self, results, **kwargs):
         if kwargs.get('json'):
-            body = results['Body'].read().decode('utf-8')
-            return jsonpickle.decode(body)
+            return serializer.loads(results['Body'].read())
         if kwargs.get('decode', True):
             return results['Body'].read().decode('utf-8')
         return results
@@ -257,7 +256,7 @@ class S3Adapter(BaseAdapter):
     def __set_body(self, **kwargs):
         data = kwargs['data']
         if kwargs.get('json'):
-            data = jsonpickle.dumps(data, unpicklable=False, use_decimal=True)
+            return serializer.encode(data) if kwargs.get('encode', True) else serializer.dumps(data)
         if kwargs.get('encode', True):
             data = bytes(data.encode('UTF-8'))
         return data
@@ -0,0 +1,71 @@
+import os
+import tempfile
+import threading
+import unittest
+import warnings
+from unittest import mock
+
+from syngenta_digital_dta.common import async_publisher
+from syngenta_digital_dta.common.async_publisher import AsyncPublisher
+from syngenta_digital_dta.common.base_adapter import BaseAdapter
+
+
+class AsyncPublisherTest(unittest.TestCase):
+
+    def setUp(self, *args, **keywargs):
+        warnings.simplefilter('ignore', ResourceWarning)
+        self.maxDiff = None
+        self.mock_sns_arn = 'arn:aws:sns:us-east-2:111111111111:unittest-mock-sns-topic'
+
+    @mock.patch('syngenta_digital_dta.common.async_publisher.publisher')
+    def test_enqueue_and_flush(self, mock_publisher):
+        async_pub = AsyncPublisher(workers=2, queue_size=10)
+        for index in range(5):
+            async_pub.enqueue(arn=self.mock_sns_arn, data={'index': index})
+        async_pub.flush(timeout=5)
+        self.assertEqual(mock_publisher.publish.call_count, 5)
+        self.assertEqual(async_pub.metrics()['published'], 5)
+        self.assertEqual(async_pub.metrics()['queue_depth'], 0)
+        mock_publisher.flush.assert_called_once()
+
+    @mock.patch('syngenta_digital_dta.common.async_publisher.publisher')
+    def test_backpressure_drop(self, mock_publisher):
+        release = threading.Event()
+        mock_publisher.publish.side_effect = lambda **kwargs: release.wait(5)
+        async_pub = AsyncPublisher(workers=1, queue_size=1, backpressure='drop')
+        for index in range(5):
+            async_pub.enqueue(arn=self.mock_sns_arn, data={'index': index})
+        self.assertGreaterEqual(async_pub.metrics()['dropped'], 3)
+        release.set()
+        async_pub.flush(timeout=5)
+
+    @mock.patch('syngenta_digital_dta.common.async_publisher.publisher')
+    def test_backpressure_spill(self, mock_publisher):
+        release = threading.Event()
+        mock_publisher.publish.side_effect = lambda **kwargs: release.wait(5)
+        spill_path = os.path.join(tempfile.mkdtemp(), 'spill.jsonl')
+        async_pub = AsyncPublisher(workers=1, queue_size=1, backpressure='spill', spill_path=spill_path)
+        for index in range(5):
+            async_pub.enqueue(arn=self.mock_sns_arn, data={'index': index})
+        self.assertGreaterEqual(async_pub.metrics()['spilled'], 3)
+        self.assertTrue(os.path.isfile(spill_path))
+        release.set()
+        async_pub.flush(timeout=5)
+        self.assertFalse(os.path.isfile(spill_path))
+        self.assertEqual(mock_publisher.publish.call_count, 5)
+
+    def test_backpressure_not_supported(self):
+        with self.assertRaises(Exception):
+            AsyncPublisher(backpressure='unknown')
+
+    def test_get_async_publisher_shared(self):
+        first = async_publisher.get_async_publisher(workers=1, queue_size=5)
+        second = async_publisher.get_async_publisher(workers=1, queue_size=5)
+        self.assertIs(first, second)
+
+    @mock.patch('syngenta_digital_dta.common.async_publisher.publisher')
+    def test_base_adapter_async_publish(self, mock_publisher):
+        base_adapter = BaseAdapter(sns_arn=self.mock_sns_arn, sns_async=True, sns_async_queue_size=7)
+        base_adapter.publish('unit-test', {'unit-test': True})
+        base_adapter.flush_events(timeout=5)
+        self.assertEqual(mock_publisher.publish.call_args.kwargs['data'], {'unit-test': True})
@@ -0,0 +1,50 @@
+import unittest
+from unittest import mock
+
+import syngenta_digital_dta
+from syngenta_digital_dta.common import boto3_pool
+
+
+class Boto3PoolTest(unittest.TestCase):
+
+    def setUp(self, *args, **kwargs):
+        self.maxDiff = None
+        boto3_pool.clear_pool()
+        self.addCleanup(boto3_pool.clear_pool)
+
+    def test_get_resource_pooled(self):
+        first = boto3_pool.get_resource('dynamodb', endpoint='http://localhost:4000', region='us-east-2')
+        second = boto3_pool.get_resource('dynamodb', endpoint='http://localhost:4000', region='us-east-2')
+        self.assertIs(first, second)
+
+    def test_get_resource_keyed_by_credentials(self):
+        first = boto3_pool.get_resource('dynamodb', region='us-east-2', aws_access_key_id='a', aws_secret_access_key='a')
+        second = boto3_pool.get_resource('dynamodb', region='us-east-2', aws_access_key_id='b', aws_secret_access_key='b')
+        self.assertIsNot(first, second)
+        self.assertEqual(first.meta.client._request_signer._credentials.access_key, 'a')
+        self.assertEqual(second.meta.client._request_signer._credentials.access_key, 'b')
+
+    def test_get_client_max_pool_connections(self):
+        client = boto3_pool.get_client('dynamodb', region='us-east-2', max_pool_connections=50)
+        self.assertEqual(client.meta.config.max_pool_connections, 50)
+        self.assertIsNot(client, boto3_pool.get_client('dynamodb', region='us-east-2'))
+
+    @mock.patch('syngenta_digital_dta.common.boto3_pool.boto3.session.Session')
+    def test_session_shared(self, mock_session):
+        boto3_pool.get_client('dynamodb', region='us-east-1')
+        boto3_pool.get_client('s3', region='us-east-2')
+        mock_session.assert_called_once_with()
+
+    def test_dynamodb_adapters_share_resource(self):
+        kwargs = {
+            'engine': 'dynamodb',
+            'endpoint': 'http://localhost:4000',
+            'model_schema': 'test-dynamo-model',
+            'model_schema_file': 'tests/openapi.yml',
+            'model_identifier': 'test_id',
+            'model_version_key': 'modified'
+        }
+        first = syngenta_digital_dta.adapter(table='unittestsort', **kwargs)
+        second = syngenta_digital_dta.adapter(table='unittest', **kwargs)
+        self.assertIs(first.table.meta.client, second.table.meta.client)
+        self.assertEqual(second.table.name, 'unittest')
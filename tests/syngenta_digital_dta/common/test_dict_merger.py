@@ -47,3 +47,109 @@ class DictMergerTest(unittest.TestCase):
         }
         results = dict_merger.merge(old_dict_list, new_dict_list, update_dict_operation='replace')
         self.assertDictEqual(results, old_dict_list)
+
+    def test_merge_shared_matches_deep(self):
+        old_dict = {
+            'key1': 'value1',
+            'nested': {'key2': 'value2', 'deeper': {'key3': 'value3'}},
+            'list1': [0, 1, 2],
+            'untouched': {'key4': [1, 2, 3]}
+        }
+        new_dict = {
+            'nested': {'deeper': {'key5': 'value5'}},
+            'list1': [2, 3],
+            'key6': 'value6'
+        }
+        for operation in ['add', 'remove', 'replace']:
+            deep = dict_merger.merge(old_dict, new_dict, update_list_operation=operation)
+            shared = dict_merger.merge(old_dict, new_dict, update_list_operation=operation, copy_mode='shared')
+            self.assertDictEqual(deep, shared)
+
+    def test_merge_shared_does_not_mutate_original(self):
+        old_dict = {
+            'nested': {'key1': 'value1'},
+            'list1': [0, 1, 2],
+            'untouched': {'key2': 'value2'}
+        }
+        new_dict = {
+            'nested': {'key1': 'changed'},
+            'list1': [3]
+        }
+        results = dict_merger.merge(old_dict, new_dict, copy_mode='shared')
+        self.assertDictEqual(old_dict, {
+            'nested': {'key1': 'value1'},
+            'list1': [0, 1, 2],
+            'untouched': {'key2': 'value2'}
+        })
+        self.assertDictEqual(results['nested'], {'key1': 'changed'})
+        self.assertListEqual(results['list1'], [0, 1, 2, 3])
+        self.assertIs(results['untouched'], old_dict['untouched'])
+
+    def test_merge_shared_remove_key(self):
+        old_dict = {
+            'key1': 'value1',
+            'nested': {'key2': 'value2', 'key3': 'value3'}
+        }
+        new_dict = {
+            'nested': {'key2': None}
+        }
+        results = dict_merger.merge(old_dict, new_dict, update_dict_operation='remove', copy_mode='shared')
+        self.assertDictEqual(results, {'key1': 'value1', 'nested': {'key3': 'value3'}})
+        self.assertIn('key2', old_dict['nested'])
+
+    def test_merge_add_array_unique(self):
+        old_dict_list = {
+            'list1': [0, 1, {'a': 1, 'b': 2}]
+        }
+        new_dict_list = {
+            'list1': [1, 3, 3, {'b': 2, 'a': 1}]
+        }
+        results = dict_merger.merge(old_dict_list, new_dict_list)
+        self.assertDictEqual(results, {'list1': [0, 1, {'a': 1, 'b': 2}, 3]})
+
+    def test_merge_remove_array_items(self):
+        old_dict_list = {
+            'list1': [0, 1, 1, 2, {'a': 1, 'b': 2}, {'a': 2}]
+        }
+        new_dict_list = {
+            'list1': [1, {'b': 2, 'a': 1}]
+        }
+        results = dict_merger.merge(old_dict_list, new_dict_list, update_list_operation='remove')
+        self.assertDictEqual(results, {'list1': [0, 2, {'a': 2}]})
+        self.assertEqual(len(old_dict_list['list1']), 6)
+
+    def test_merge_add_array_key_field(self):
+        old_dict_list = {
+            'list1': [{'id': 1, 'value': 'a'}, {'id': 2, 'value': 'b'}]
+        }
+        new_dict_list = {
+            'list1': [{'id': 2, 'value': 'c'}, {'id': 3, 'value': 'd'}]
+        }
+        results = dict_merger.merge(old_dict_list, new_dict_list, update_list_key_field='id')
+        self.assertDictEqual(results, {
+            'list1': [{'id': 1, 'value': 'a'}, {'id': 2, 'value': 'c'}, {'id': 3, 'value': 'd'}]
+        })
+
+    def test_merge_remove_array_key_field(self):
+        old_dict_list = {
+            'list1': [{'id': 1, 'value': 'a'}, {'id': 2, 'value': 'b'}]
+        }
+        new_dict_list = {
+            'list1': [{'id': 2}]
+        }
+        results = dict_merger.merge(
+            old_dict_list, new_dict_list, update_list_operation='remove', update_list_key_field='id')
+        self.assertDictEqual(results, {'list1': [{'id': 1, 'value': 'a'}]})
+
+    def test_flatten_paths(self):
+        new_dict = {
+            'key1': 'value1',
+            'nested': {'key2': 'value2', 'deeper': {'key3': [1]}, 'empty': {}}
+        }
+        results = list(dict_merger.flatten_paths(new_dict))
+        self.assertListEqual(results, [
+            (('key1',), 'value1'),
+            (('nested', 'key2'), 'value2'),
+            (('nested', 'deeper', 'key3'), [1]),
+            (('nested', 'empty'), {})
+        ])
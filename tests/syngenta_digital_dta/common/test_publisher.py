@@ -1,5 +1,6 @@
 import unittest
 import warnings
+from unittest import mock
 
 from syngenta_digital_dta.common import publisher
 
@@ -20,3 +21,81 @@ class PublisherTest(unittest.TestCase):
             region='us-east-2',
             operation='create'
         )
+
+    @mock.patch('syngenta_digital_dta.common.publisher.boto3.client')
+    def test_get_client_cached(self, mock_client):
+        first = publisher.get_client('us-east-1', 'http://localhost:4001')
+        second = publisher.get_client('us-east-1', 'http://localhost:4001')
+        self.assertIs(first, second)
+        mock_client.assert_called_once_with('sns', region_name='us-east-1', endpoint_url='http://localhost:4001')
+
+    @mock.patch('syngenta_digital_dta.common.publisher.get_client')
+    def test_publish_buffered_flush_by_size(self, mock_get_client):
+        for index in range(11):
+            publisher.publish(arn=self.mock_sns_arn, data={'index': index}, buffered=True, max_age=60)
+        publish_batch = mock_get_client.return_value.publish_batch
+        self.assertEqual(publish_batch.call_count, 1)
+        self.assertEqual(len(publish_batch.call_args.kwargs['PublishBatchRequestEntries']), 10)
+        publisher.flush()
+        self.assertEqual(publish_batch.call_count, 2)
+        self.assertEqual(publish_batch.call_args.kwargs['PublishBatchRequestEntries'][0]['Message'], '{"index":10}')
+
+    @mock.patch('syngenta_digital_dta.common.publisher.get_client')
+    def test_publish_buffered_flush_by_age(self, mock_get_client):
+        publisher.publish(arn=self.mock_sns_arn, data={'index': 0}, buffered=True, max_age=0)
+        self.assertEqual(mock_get_client.return_value.publish_batch.call_count, 1)
+
+    @mock.patch('syngenta_digital_dta.common.publisher.get_client')
+    def test_publish_buffered_fifo(self, mock_get_client):
+        publisher.publish(
+            arn=self.mock_sns_arn,
+            data={'key': 'value'},
+            buffered=True,
+            max_age=60,
+            fifo_group_id='group',
+            fifo_duplication_id='dedup'
+        )
+        publisher.flush()
+        entry = mock_get_client.return_value.publish_batch.call_args.kwargs['PublishBatchRequestEntries'][0]
+        self.assertEqual(entry['MessageGroupId'], 'group')
+        self.assertEqual(entry['MessageDeduplicationId'], 'dedup')
+
+    @mock.patch('syngenta_digital_dta.common.publisher.get_client')
+    def test_publish_batch_packs_items(self, mock_get_client):
+        publisher.publish(arn=self.mock_sns_arn, data=[{'index': index} for index in range(3)], batch=True)
+        publish_batch = mock_get_client.return_value.publish_batch
+        self.assertEqual(publish_batch.call_count, 1)
+        entries = publish_batch.call_args.kwargs['PublishBatchRequestEntries']
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0]['Message'], '[{"index":0},{"index":1},{"index":2}]')
+
+    @mock.patch('syngenta_digital_dta.common.publisher.get_client')
+    def test_publish_batch_splits_by_size(self, mock_get_client):
+        items = [{'index': index, 'payload': 'x' * 100000} for index in range(25)]
+        publisher.publish(arn=self.mock_sns_arn, data=items, batch=True)
+        publish_batch = mock_get_client.return_value.publish_batch
+        messages = []
+        for call in publish_batch.call_args_list:
+            entries = call.kwargs['PublishBatchRequestEntries']
+            self.assertLessEqual(len(entries), publisher.MAX_BATCH_ENTRIES)
+            self.assertLessEqual(sum(len(entry['Message']) for entry in entries), publisher.MAX_BATCH_BYTES)
+            messages.extend(entry['Message'] for entry in entries)
+        self.assertEqual(len(messages), 13)
+        self.assertEqual(publish_batch.call_count, 13)
+
+    @mock.patch('syngenta_digital_dta.common.publisher.get_client')
+    def test_publish_batch_fifo(self, mock_get_client):
+        items = [{'index': index, 'payload': 'x' * 100000} for index in range(4)]
+        publisher.publish(
+            arn=self.mock_sns_arn,
+            data=items,
+            batch=True,
+            fifo_group_id='group',
+            fifo_duplication_id='dedup'
+        )
+        dedup_ids = [
+            entry['MessageDeduplicationId']
+            for call in mock_get_client.return_value.publish_batch.call_args_list
+            for entry in call.kwargs['PublishBatchRequestEntries']
+        ]
+        self.assertListEqual(dedup_ids, ['dedup-0', 'dedup-1'])
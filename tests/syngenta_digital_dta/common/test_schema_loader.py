@@ -0,0 +1,55 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from syngenta_digital_dta.common import schema_loader
+
+
+class SchemaLoaderTest(unittest.TestCase):
+
+    def setUp(self, *args, **kwargs):
+        self.maxDiff = None
+        schema_loader.clear_cache()
+
+    def test_load_schema(self):
+        schema = schema_loader.load_schema('tests/openapi.yml', 'test-dynamo-model')
+        self.assertEqual(schema['type'], 'object')
+        self.assertIn('test_id', schema['properties'])
+
+    def test_load_schema_cache_hit(self):
+        first = schema_loader.load_schema('tests/openapi.yml', 'test-dynamo-model')
+        second = schema_loader.load_schema('tests/openapi.yml', 'test-dynamo-model')
+        self.assertIs(first, second)
+        self.assertEqual(schema_loader.cache_info()['hits'], 1)
+        self.assertEqual(schema_loader.cache_info()['misses'], 1)
+
+    def test_load_schema_resolves_refs(self):
+        schema = schema_loader.load_schema('tests/openapi.yml', 'v1-test-request')
+        self.assertIn('test_id', schema['allOf'][0]['properties'])
+
+    def test_load_schema_invalidates_on_change(self):
+        directory = tempfile.mkdtemp()
+        schema_file = os.path.join(directory, 'openapi.yml')
+        shutil.copyfile('tests/openapi.yml', schema_file)
+        try:
+            schema_loader.load_schema(schema_file, 'test-dynamo-model')
+            with open(schema_file, 'a', encoding='UTF-8') as openapi:
+                openapi.write('        test-appended-model:\n            type: object\n')
+            schema = schema_loader.load_schema(schema_file, 'test-appended-model')
+            self.assertEqual(schema['type'], 'object')
+            schema_loader.load_schema(schema_file, 'test-dynamo-model')
+            self.assertEqual(schema_loader.cache_info()['misses'], 3)
+        finally:
+            shutil.rmtree(directory)
+
+    def test_warm_cache(self):
+        schemas = schema_loader.warm_cache('tests/openapi.yml', ['test-dynamo-model', 'test-mongo-model'])
+        self.assertListEqual(list(schemas.keys()), ['test-dynamo-model', 'test-mongo-model'])
+        schema_loader.load_schema('tests/openapi.yml', 'test-mongo-model')
+        self.assertEqual(schema_loader.cache_info()['hits'], 1)
+
+    def test_warm_cache_all(self):
+        schema_loader.warm_cache('tests/openapi.yml')
+        self.assertEqual(schema_loader.cache_info()['documents'], 1)
+        self.assertGreater(schema_loader.cache_info()['schemas'], 1)
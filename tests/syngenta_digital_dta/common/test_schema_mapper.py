@@ -1,3 +1,4 @@
+import json
 import unittest
 
 from syngenta_digital_dta.common import schema_mapper
@@ -68,3 +69,63 @@ class SchemaMapperTest(unittest.TestCase):
             'created': None,
             'modified': None}
         )
+
+    def test_map_to_schema_compiled_matches_walk(self):
+        records = [
+            {
+                'test_id': 'abc456',
+                'ignore_key': True,
+                'object_key': {},
+                'array_number': [],
+                'array_objects': [{'array_string_key': 'a', 'ignore_key': 1}, 'not-an-object', {}],
+                'created': None
+            },
+            {
+                'test_id': 'abc456',
+                'object_key': 'not-an-object',
+                'array_objects': {'not': 'a-list'}
+            },
+            {},
+            None
+        ]
+        for schema_key in ['test-dynamo-model', 'v1-test-request']:
+            for data in records:
+                compiled = schema_mapper.map_to_schema(data, 'tests/openapi.yml', schema_key)
+                walked = schema_mapper.map_to_schema(data, 'tests/openapi.yml', schema_key, compiled=False)
+                self.assertEqual(json.dumps(compiled), json.dumps(walked))
+
+    def test_compile_mapper_cached(self):
+        first = schema_mapper.compile_mapper('tests/openapi.yml', 'test-dynamo-model')
+        second = schema_mapper.compile_mapper('tests/openapi.yml', 'test-dynamo-model')
+        self.assertIs(first, second)
+
+    def test_map_many(self):
+        data = [
+            {'test_id': 'abc456', 'ignore_key': True, 'object_key': {'string_key': 'nothing'}},
+            {'test_id': 'abc789', 'array_objects': [{'array_string_key': 'a', 'array_number_key': 1}]}
+        ]
+        results = list(schema_mapper.map_many(data, 'tests/openapi.yml', 'test-dynamo-model'))
+        self.assertListEqual(results, [
+            schema_mapper.map_to_schema(item, 'tests/openapi.yml', 'test-dynamo-model', compiled=False)
+            for item in data
+        ])
+
+    def test_map_many_workers(self):
+        data = ({'test_id': str(index), 'ignore_key': True} for index in range(25))
+        results = list(schema_mapper.map_many(data, 'tests/openapi.yml', 'test-dynamo-model', workers=2, chunk_size=10))
+        self.assertListEqual([result['test_id'] for result in results], [str(index) for index in range(25)])
+        self.assertNotIn('ignore_key', results[0])
+
+    def test_map_partial_to_schema(self):
+        data = {
+            'test_id': 'abc456',
+            'ignore_key': True,
+            'object_key': {'ignore_key': True},
+            'array_objects': [{'array_string_key': 'a'}]
+        }
+        results = schema_mapper.map_partial_to_schema(data, 'tests/openapi.yml', 'test-dynamo-model')
+        self.assertDictEqual(results, {
+            'test_id': 'abc456',
+            'object_key': {},
+            'array_objects': [{'array_string_key': 'a', 'array_number_key': None}]
+        })
@@ -0,0 +1,71 @@
+import datetime
+import decimal
+import unittest
+
+from boto3.dynamodb.types import Binary
+
+from syngenta_digital_dta.common import serializer
+
+
+class SerializerTest(unittest.TestCase):
+
+    def setUp(self, *args, **kwargs):
+        self.maxDiff = None
+        self.backend = serializer.get_backend()
+        self.item = {
+            'test_id': 'abc123',
+            'price': decimal.Decimal('10.5'),
+            'count': decimal.Decimal('3'),
+            'created': datetime.datetime(2020, 10, 5, 12, 30),
+            'day': datetime.date(2020, 10, 5),
+            'raw': b'unit-test',
+            'binary': Binary(b'unit-test'),
+            'tags': ['a', 'b'],
+            'name': 'ü'
+        }
+        self.expected = (
+            '{"test_id":"abc123","price":10.5,"count":3,"created":"2020-10-05T12:30:00","day":"2020-10-05",'
+            '"raw":"dW5pdC10ZXN0","binary":"dW5pdC10ZXN0","tags":["a","b"],"name":"ü"}'
+        )
+
+    def tearDown(self):
+        serializer.set_backend(self.backend)
+
+    def test_dumps_simplejson(self):
+        serializer.set_backend('simplejson')
+        self.assertEqual(serializer.dumps(self.item), self.expected)
+
+    def test_dumps_orjson(self):
+        try:
+            serializer.set_backend('orjson')
+        except Exception:
+            self.skipTest('orjson not installed')
+        self.assertEqual(serializer.dumps(self.item), self.expected)
+
+    def test_dumps_large_decimal(self):
+        self.assertEqual(serializer.dumps({'value': decimal.Decimal('1' * 38)}), '{"value":' + '1' * 38 + '}')
+
+    def test_dumps_sort_keys_default(self):
+        result = serializer.dumps({'b': object, 'a': 1}, sort_keys=True, default=lambda value: 'object')
+        self.assertEqual(result, '{"a":1,"b":"object"}')
+
+    def test_dumps_unsupported_type(self):
+        self.assertRaises(TypeError, serializer.dumps, {'value': object()})
+
+    def test_encode_bytes(self):
+        self.assertEqual(serializer.encode({'key': 'value'}), b'{"key":"value"}')
+
+    def test_loads(self):
+        self.assertDictEqual(serializer.loads(b'{"price": 10.5}'), {'price': 10.5})
+
+    def test_loads_use_decimal(self):
+        self.assertDictEqual(serializer.loads('{"price": 10.50}', use_decimal=True), {'price': decimal.Decimal('10.50')})
+
+    def test_register_backend(self):
+        serializer.register_backend('unit-test', lambda data, **kwargs: b'"unit-test"', lambda data: 'unit-test')
+        serializer.set_backend('unit-test')
+        self.assertEqual(serializer.dumps({}), '"unit-test"')
+        self.assertEqual(serializer.loads('{}'), 'unit-test')
+
+    def test_set_backend_unknown(self):
+        self.assertRaises(Exception, serializer.set_backend, 'unknown')
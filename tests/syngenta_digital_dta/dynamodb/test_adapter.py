@@ -1,9 +1,14 @@
 import unittest
 import warnings
+from decimal import Decimal
 from unittest import mock
 
+from boto3.dynamodb.types import Binary
+
 import syngenta_digital_dta
 from syngenta_digital_dta.dynamodb.adapter import BatchItemException
+from syngenta_digital_dta.dynamodb.adapter import _decode_continuation_token
+from syngenta_digital_dta.dynamodb.adapter import _encode_continuation_token
 from tests.syngenta_digital_dta.dynamodb.mock_table import MockTable
 
 
@@ -103,6 +108,24 @@ class DynamoDBAdapterTest(unittest.TestCase):
         data = self.adapter.scan()
         self.assertDictEqual(data[0], self.mock_table.mock_data)
 
+    def test_adapter_scan_segments(self):
+        self.adapter.batch_insert(data=[{'test_id': str(x), 'test_query_id': str(x)} for x in range(100)])
+        progress = []
+        data = self.adapter.scan(segments=4, progress=progress.append)
+        self.assertEqual(len(data), 101)
+        self.assertListEqual(
+            sorted(item['test_id'] for item in data),
+            sorted(item['test_id'] for item in self.adapter.scan())
+        )
+        finished = [segment for segment in progress if segment['finished']]
+        self.assertListEqual(sorted(segment['segment'] for segment in finished), [0, 1, 2, 3])
+        self.assertEqual(sum(segment['items'] for segment in finished), 101)
+
+    def test_adapter_scan_segments_limit(self):
+        self.adapter.batch_insert(data=[{'test_id': str(x), 'test_query_id': str(x)} for x in range(100)])
+        data = self.adapter.scan(segments=4, query={'Limit': 10})
+        self.assertEqual(len(data), 10)
+
     def test_adapter_raw_scan(self):
         data = self.adapter.scan(**{'raw_scan': True})
         self.assertDictEqual(data[0]['Items'][0], self.mock_table.mock_data)
@@ -135,6 +158,20 @@ class DynamoDBAdapterTest(unittest.TestCase):
         data = self.adapter.scan()
         self.assertTrue(len(data) == 101)  # Table comes initialized with one test record
 
+    def test_adapter_batch_insert_summary(self):
+        item_list = {'data': [{'test_id': str(x), 'test_query_id': str(x)} for x in range(100)]}
+        summary = self.adapter.batch_insert(concurrency=4, **item_list)
+        self.assertDictEqual(summary, {'written': 100, 'retried': 0, 'failed': 0, 'throttled': 0, 'failed_requests': []})
+
+    @mock.patch('syngenta_digital_dta.common.publisher.publish')
+    def test_adapter_batch_insert_publish(self, mock_publish):
+        self.adapter.sns_arn = 'arn:aws:sns:us-east-2:111111111111:unittest-mock-sns-topic'
+        item_list = {'data': [{'test_id': str(x), 'test_query_id': str(x)} for x in range(30)]}
+        self.adapter.batch_insert(**item_list)
+        mock_publish.assert_called_once()
+        self.assertTrue(mock_publish.call_args.kwargs['batch'])
+        self.assertCountEqual(mock_publish.call_args.kwargs['data'], item_list['data'])
+
     def test_adapter_batch_insert_fail(self):
         item_tuple = {'data': (1, 2, 3)}
         self.assertRaises(BatchItemException, self.adapter.batch_insert, **item_tuple)
@@ -233,6 +270,74 @@ class DynamoDBAdapterTest(unittest.TestCase):
         )
         self.assertDictEqual(updated_data, new_data)
 
+    def test_adapter_update_patch(self):
+        updated_data = self.adapter.update(
+            patch=True,
+            data={
+                'test_id': 'abc123',
+                'object_key': {'string_key': 'patched'},
+                'array_number': [4],
+                'ignore_key': True,
+                'modified': '2020-10-06'
+            },
+            query={
+                'Key': {
+                    'test_id': 'abc123',
+                    'test_query_id': 'def345'
+                }
+            }
+        )
+        expected_data = {
+            **self.mock_table.mock_data,
+            'object_key': {'string_key': 'patched'},
+            'array_number': [1, 2, 3, 4],
+            'modified': '2020-10-06'
+        }
+        self.assertDictEqual(updated_data, expected_data)
+
+    def test_adapter_update_patch_remove(self):
+        updated_data = self.adapter.update(
+            patch=True,
+            update_dict_operation='remove',
+            data={'created': None},
+            query={
+                'Key': {
+                    'test_id': 'abc123',
+                    'test_query_id': 'def345'
+                }
+            }
+        )
+        self.assertNotIn('created', updated_data)
+
+    def test_adapter_update_patch_version_conflict(self):
+        with self.assertRaises(Exception) as context:
+            self.adapter.update(
+                patch=True,
+                expected_version='2000-01-01',
+                data={'modified': '2020-10-06'},
+                query={
+                    'Key': {
+                        'test_id': 'abc123',
+                        'test_query_id': 'def345'
+                    }
+                }
+            )
+        self.assertIn('ConditionalCheckFailed', str(context.exception))
+
+    def test_build_update_expression(self):
+        expression = self.adapter._build_update_expression(
+            {'test_id': 'abc123', 'object_key': {'string_key': 'value'}, 'array_number': [4], 'created': None},
+            {'test_id': 'abc123'},
+            update_list_operation='replace'
+        )
+        self.assertDictEqual(expression, {
+            'UpdateExpression': 'SET #p0.#p1 = :p0, #p2 = :p1, #p3 = :p2',
+            'ExpressionAttributeNames': {
+                '#p0': 'object_key', '#p1': 'string_key', '#p2': 'array_number', '#p3': 'created'
+            },
+            'ExpressionAttributeValues': {':p0': 'value', ':p1': [4], ':p2': None}
+        })
+
     def test_adapter_delete(self):
         new_data = {
             'test_id': 'abc456-delete',
@@ -380,3 +485,119 @@ class DynamoDBAdapterTest(unittest.TestCase):
         )
 
         self.assertListEqual(self.mock_table.mock_pagination_data, data)
+
+    def test_iter_query(self):
+        self.adapter.table = mock.MagicMock()
+        self.adapter.table.query.side_effect = self.mock_table.mock_pagination_data
+
+        data = self.adapter.iter_query()
+
+        self.adapter.table.query.assert_not_called()
+        self.assertListEqual([self.mock_table.mock_data, self.mock_table.mock_data], list(data))
+        self.adapter.table.query.assert_has_calls(
+            calls=[
+                mock.call(),
+                mock.call(ExclusiveStartKey={'somekey': 'somevalue'})
+            ]
+        )
+
+    def test_iter_query_pages_prefetch(self):
+        self.adapter.table = mock.MagicMock()
+        self.adapter.table.query.side_effect = self.mock_table.mock_pagination_data
+
+        data = list(self.adapter.iter_query(pages=True, prefetch=True))
+
+        self.assertListEqual(self.mock_table.mock_pagination_data, data)
+        self.assertEqual(self.adapter.table.query.call_count, 2)
+
+    def test_iter_scan_limit(self):
+        self.adapter.table = mock.MagicMock()
+        self.adapter.table.scan.side_effect = self.mock_table.mock_pagination_data
+
+        data = list(self.adapter.iter_scan(query={'Limit': 1}, prefetch=True))
+
+        self.adapter.table.scan.assert_called_once_with(Limit=1)
+        self.assertListEqual([self.mock_table.mock_data], data)
+
+    def test_iter_scan_segments(self):
+        self.adapter.batch_insert(data=[{'test_id': str(x), 'test_query_id': str(x)} for x in range(50)])
+        data = list(self.adapter.iter_scan(segments=3))
+        self.assertEqual(len(data), 51)
+
+    def test_query_continuation_token(self):
+        self.adapter.batch_insert(data=[{'test_id': str(x), 'test_query_id': 'paged'} for x in range(25)])
+        query = {
+            'IndexName': 'test_query_id',
+            'KeyConditionExpression': 'test_query_id = :test_query_id',
+            'ExpressionAttributeValues': {':test_query_id': 'paged'}
+        }
+        items = []
+        pages = 0
+        continuation_token = None
+        while True:
+            page = self.adapter.query(query=query, page_size=10, continuation_token=continuation_token)
+            items.extend(page['items'])
+            pages += 1
+            self.assertLessEqual(len(page['items']), 10)
+            continuation_token = page['continuation_token']
+            if not continuation_token:
+                break
+        self.assertEqual(pages, 3)
+        self.assertListEqual(sorted(item['test_id'] for item in items), sorted(str(x) for x in range(25)))
+
+    def test_scan_continuation_token_mock(self):
+        self.adapter.table = mock.MagicMock()
+        self.adapter.table.scan.side_effect = self.mock_table.mock_pagination_data
+
+        page = self.adapter.scan(page_size=1)
+
+        self.adapter.table.scan.assert_called_once_with(Limit=1)
+        self.assertListEqual(page['items'], [self.mock_table.mock_data])
+        self.assertDictEqual(_decode_continuation_token(page['continuation_token']), {'somekey': 'somevalue'})
+
+    def test_continuation_token_round_trip(self):
+        last_evaluated_key = {'test_id': 'abc123', 'number': Decimal('12345678901234567890.123'), 'raw': Binary(b'\x00')}
+        continuation_token = _encode_continuation_token(last_evaluated_key)
+        self.assertIsInstance(continuation_token, str)
+        self.assertDictEqual(_decode_continuation_token(continuation_token), last_evaluated_key)
+
+    def test_continuation_token_invalid(self):
+        self.assertRaises(Exception, self.adapter.query, page_size=10, continuation_token='not-a-token')
+
+    def test_adapter_batch_get(self):
+        self.adapter.batch_insert(data=[{'test_id': str(x), 'test_query_id': str(x)} for x in range(250)])
+        keys = [{'test_id': str(x), 'test_query_id': str(x)} for x in reversed(range(260))]
+        data = self.adapter.batch_get(keys=keys)
+        self.assertListEqual([item['test_id'] for item in data], [str(x) for x in reversed(range(250))])
+
+    def test_adapter_batch_get_as_dict(self):
+        data = self.adapter.batch_get(keys=[{'test_id': 'abc123', 'test_query_id': 'def345'}], as_dict=True)
+        self.assertListEqual(list(data.keys()), ['abc123'])
+        self.assertEqual(data['abc123']['test_query_id'], 'def345')
+
+    @mock.patch('syngenta_digital_dta.dynamodb.adapter.time.sleep')
+    def test_adapter_batch_get_unprocessed_keys(self, mock_sleep):
+        key = {'test_id': 'abc123', 'test_query_id': 'def345'}
+        self.adapter.table = mock.MagicMock()
+        self.adapter.table.name = 'unittestsort'
+        self.adapter.table.meta.client.batch_get_item.side_effect = [
+            {'Responses': {'unittestsort': []}, 'UnprocessedKeys': {'unittestsort': {'Keys': [key]}}},
+            {'Responses': {'unittestsort': [self.mock_table.mock_data]}}
+        ]
+        data = self.adapter.batch_get(keys=[key])
+        self.assertListEqual(data, [self.mock_table.mock_data])
+        self.assertEqual(mock_sleep.call_count, 1)
+        self.adapter.table.meta.client.batch_get_item.assert_called_with(
+            RequestItems={'unittestsort': {'Keys': [key]}}
+        )
+
+    @mock.patch('syngenta_digital_dta.dynamodb.adapter.time.sleep')
+    def test_adapter_batch_get_unprocessed_keys_fail(self, mock_sleep):
+        key = {'test_id': 'abc123', 'test_query_id': 'def345'}
+        self.adapter.table = mock.MagicMock()
+        self.adapter.table.name = 'unittestsort'
+        self.adapter.table.meta.client.batch_get_item.return_value = {
+            'Responses': {}, 'UnprocessedKeys': {'unittestsort': {'Keys': [key]}}
+        }
+        self.assertRaises(BatchItemException, self.adapter.batch_get, keys=[key], max_retries=2)
+        self.assertEqual(mock_sleep.call_count, 2)
@@ -0,0 +1,62 @@
+import unittest
+from unittest import mock
+
+from botocore.exceptions import ClientError
+
+from syngenta_digital_dta.dynamodb.batch_writer import BatchWriter
+
+
+class BatchWriterTest(unittest.TestCase):
+
+    def setUp(self, *args, **kwargs):
+        self.maxDiff = None
+        self.table = mock.MagicMock()
+        self.table.name = 'unittest'
+        self.requests = [{'PutRequest': {'Item': {'test_id': str(x)}}} for x in range(60)]
+        patcher = mock.patch('syngenta_digital_dta.dynamodb.batch_writer.time.sleep')
+        self.mock_sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_write_chunks(self):
+        self.table.meta.client.batch_write_item.return_value = {'UnprocessedItems': {}}
+        summary = BatchWriter(self.table, concurrency=2).write(iter(self.requests))
+        self.assertEqual(self.table.meta.client.batch_write_item.call_count, 3)
+        self.assertDictEqual(summary, {'written': 60, 'retried': 0, 'failed': 0, 'throttled': 0, 'failed_requests': []})
+
+    def test_write_batch_size(self):
+        self.table.meta.client.batch_write_item.return_value = {'UnprocessedItems': {}}
+        BatchWriter(self.table, batch_size=10).write(self.requests)
+        self.assertEqual(self.table.meta.client.batch_write_item.call_count, 6)
+
+    def test_write_retries_unprocessed(self):
+        self.table.meta.client.batch_write_item.side_effect = [
+            {'UnprocessedItems': {'unittest': self.requests[:2]}},
+            {'UnprocessedItems': {}}
+        ]
+        writer = BatchWriter(self.table, track_written=True)
+        summary = writer.write(self.requests[:5])
+        self.table.meta.client.batch_write_item.assert_called_with(RequestItems={'unittest': self.requests[:2]})
+        self.assertEqual(summary['written'], 5)
+        self.assertEqual(summary['retried'], 2)
+        self.assertCountEqual(writer.written_requests, self.requests[:5])
+
+    def test_write_fails_after_retries(self):
+        self.table.meta.client.batch_write_item.return_value = {'UnprocessedItems': {'unittest': self.requests[:1]}}
+        summary = BatchWriter(self.table, max_retries=2).write(self.requests[:3])
+        self.assertEqual(summary['written'], 2)
+        self.assertEqual(summary['retried'], 2)
+        self.assertEqual(summary['failed'], 1)
+        self.assertListEqual(summary['failed_requests'], self.requests[:1])
+
+    def test_write_throttled(self):
+        throttled = ClientError({'Error': {'Code': 'ProvisionedThroughputExceededException'}}, 'BatchWriteItem')
+        self.table.meta.client.batch_write_item.side_effect = [throttled, {'UnprocessedItems': {}}]
+        summary = BatchWriter(self.table).write(self.requests[:3])
+        self.assertEqual(summary['throttled'], 1)
+        self.assertEqual(summary['written'], 3)
+        self.assertEqual(summary['retried'], 3)
+
+    def test_write_raises_other_errors(self):
+        error = ClientError({'Error': {'Code': 'ValidationException'}}, 'BatchWriteItem')
+        self.table.meta.client.batch_write_item.side_effect = error
+        self.assertRaises(ClientError, BatchWriter(self.table).write, self.requests[:3])
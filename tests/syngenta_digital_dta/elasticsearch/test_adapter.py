@@ -119,6 +119,21 @@ class ElasticsearchAdapterTest(unittest.TestCase):
         except Exception:
             self.assertEqual(False, True)
 
+    def test_batch_create(self):
+        data = [
+            {
+                'user_id': uuid.uuid4().hex,
+                'email': 'some.user@syngenta.com',
+                'first': 'Some',
+                'last': 'User',
+                'phone': 1112224444
+            }
+            for _ in range(10)
+        ]
+        success, errors = self.adapter.batch_create(data=data)
+        self.assertEqual(success, len(data))
+        self.assertListEqual(errors, [])
+
     def test_create_uniqueness(self):
         unique = uuid.uuid4().hex
         data = {
@@ -160,6 +160,34 @@ class MongoAdapterTest(unittest.TestCase):
         except Exception as error:
             self.assertTrue('no document found by query:' in repr(error))
 
+    def test_update_patch(self):
+        data = mock_data.get_standard()
+        self.adapter.create(data=data)
+        result = self.adapter.update(
+            patch=True,
+            query={'test_id': data['test_id']},
+            data={'object_key': {'string_key': 'patched'}, 'array_number': [3, 4], 'ignore_key': True}
+        )
+        result.pop('_id')
+        data['object_key']['string_key'] = 'patched'
+        data['array_number'] = [1, 2, 3, 4]
+        self.assertDictEqual(result, data)
+        self.adapter.delete(query={'test_id': data['test_id']})  # clean up
+
+    def test_update_patch_remove(self):
+        data = mock_data.get_standard()
+        self.adapter.create(data=data)
+        result = self.adapter.update(
+            patch=True,
+            query={'test_id': data['test_id']},
+            data={'array_number': [1, 2], 'created': None},
+            update_list_operation='remove',
+            update_dict_operation='remove'
+        )
+        self.assertListEqual(result['array_number'], [3])
+        self.assertNotIn('created', result)
+        self.adapter.delete(query={'test_id': data['test_id']})  # clean up
+
     def test_upsert(self):
         data = mock_data.get_standard()
         result = self.adapter.upsert(query={'test_id': data['test_id']}, data=data)
@@ -149,6 +149,26 @@ class PostgresAdapterTest(unittest.TestCase):
         except Exception as error:
             self.assertEqual(str(error), 'row does not exist with user_id = some-update-guid-fail')
 
+    def test_update_patch(self):
+        data = {
+            'user_id': 'some-patch-guid',
+            'email': 'paul.cruse@syngenta.com',
+            'first': 'Paul',
+            'last': 'Cruse III'
+        }
+        self.user_adapter.upsert(data=data, commit=True)
+        result = self.user_adapter.update(data={'user_id': 'some-patch-guid', 'last': 'Cruse'}, patch=True, commit=True)
+        self.assertDictEqual(result, {'user_id': 'some-patch-guid', 'last': 'Cruse'})
+        data['last'] = 'Cruse'
+        self.assertDictEqual(data, self.user_adapter.get('some-patch-guid'))
+
+    def test_update_patch_fail(self):
+        try:
+            self.user_adapter.update(data={'user_id': 'some-patch-guid-fail', 'last': 'Cruse'}, patch=True, commit=True)
+            self.assertTrue(False)
+        except Exception as error:
+            self.assertEqual(str(error), 'row does not exist with user_id = some-patch-guid-fail')
+
     def test_upsert(self):
         data = {
             'user_id': 'some-non-unique-guid',